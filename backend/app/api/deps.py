@@ -3,88 +3,243 @@ API dependencies for the application.
 
 This module defines dependencies that can be used in API endpoints.
 """
-from typing import AsyncGenerator, Optional
+import uuid
+from functools import lru_cache
+from typing import Optional
 
-from fastapi import Depends, HTTPException, status
-from sqlalchemy import select
+from cachetools import TTLCache
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.config import settings
+from app.core.security import verify_token
 from app.db.session import get_db
 from app.models.user import User
 from app.services.openai_service import OpenAIService
 from app.services.storage import StorageService
-from app.services.supabase import SupabaseUser, get_current_user
+from app.services.supabase import SupabaseUser
+from app.services.supabase import get_current_user as get_supabase_user
+
+# OAuth2 password bearer for token authentication
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
+
+
+async def get_token_payload(
+    request: Request,
+    token: str = Depends(oauth2_scheme),
+) -> dict:
+    """
+    Verify and decode the JWT token once per request.
+
+    The decoded payload is stashed on `request.state` so any other code
+    that needs the claims (middleware, additional dependencies) reuses the
+    result instead of re-running the HMAC verification.
+
+    Args:
+        request: Current request
+        token: JWT token
+
+    Returns:
+        dict: Decoded token payload
+
+    Raises:
+        HTTPException: If token is invalid
+    """
+    payload = getattr(request.state, "jwt_payload", None)
+    if payload is not None:
+        return payload
+
+    payload = verify_token(token)
+    if not payload:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    request.state.jwt_payload = payload
+    return payload
+
+
+async def get_current_user_id(
+    payload: dict = Depends(get_token_payload),
+) -> uuid.UUID:
+    """
+    Get the current user's ID from the JWT without touching the database.
+
+    Access tokens are short-lived, so within their TTL the signed `sub` claim
+    is trusted as-is. Endpoints that only need the caller's identity (e.g.
+    for ownership checks) should depend on this instead of `get_current_user`
+    to keep the auth path free of DB round-trips; revocation lag is bounded
+    by the token TTL.
+
+    Args:
+        payload: Decoded JWT payload
+
+    Returns:
+        uuid.UUID: Current user's ID
+
+    Raises:
+        HTTPException: If the token payload is invalid
+    """
+    user_id = payload.get("sub")
+    if not user_id:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token payload",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    try:
+        return uuid.UUID(user_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token payload",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+async def get_current_user(
+    db: AsyncSession = Depends(get_db),
+    user_id: uuid.UUID = Depends(get_current_user_id),
+) -> User:
+    """
+    Get the current authenticated user from the JWT token.
+
+    This is the canonical JWT dependency; every endpoint should depend on
+    this exact callable so FastAPI's per-request dependency cache hits
+    instead of re-validating the token and re-querying the user. Endpoints
+    that don't need the row itself should prefer `get_current_user_id`.
+
+    Args:
+        db: Database session
+        user_id: Current user's ID from the JWT
+
+    Returns:
+        User: Current authenticated user
+
+    Raises:
+        HTTPException: If token is invalid or user not found
+    """
+    # Primary-key lookup: uses the identity map and skips query compilation
+    user = await db.get(User, user_id)
+
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found",
+        )
+
+    return user
+
+
+# Cache mapping supabase_id -> (user_id, is_active) so repeat requests can
+# use the primary-key fast path instead of a filtered SELECT. The mapping is
+# effectively immutable, so the TTL is long and profile writes invalidate
+# explicitly via invalidate_user_lookup().
+_user_lookup_cache: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+
+
+def invalidate_user_lookup(supabase_id: Optional[str]) -> None:
+    """
+    Drop a user's cached supabase_id -> user_id mapping.
+
+    Called by endpoints that mutate user rows (e.g. deactivation) so the
+    next request re-reads the row instead of trusting a stale cache entry.
+
+    Args:
+        supabase_id: Supabase ID of the mutated user, if any
+    """
+    if supabase_id:
+        _user_lookup_cache.pop(supabase_id, None)
+
+# Pre-built statement for the cache-miss path; built once at import so each
+# request only binds parameters instead of re-entering the SQL compiler.
+_USER_BY_SUPABASE_ID = (
+    select(User).where(User.supabase_id == bindparam("supabase_id")).limit(1)
+)
 
 
 async def get_current_active_user(
     db: AsyncSession = Depends(get_db),
-    current_user: SupabaseUser = Depends(get_current_user),
+    current_user: SupabaseUser = Depends(get_supabase_user),
 ) -> User:
     """
     Get current active user from database.
-    
+
     This dependency gets the current authenticated user from the database
-    and checks if the user is active.
-    
+    and checks if the user is active. FastAPI caches the result for the
+    lifetime of the request, so endpoints should depend on this instead of
+    re-querying the users table; across requests, a short-TTL cache maps the
+    Supabase ID to the primary key so the lookup can use `session.get()`.
+
     Args:
         db: Database session
         current_user: Current authenticated Supabase user
-        
+
     Returns:
         User: Current active user
-        
+
     Raises:
         HTTPException: If user not found or inactive
     """
-    result = await db.execute(
-        select(User).where(User.supabase_id == current_user.id)
-    )
-    user = result.scalars().first()
-    
+    user = None
+
+    cached = _user_lookup_cache.get(current_user.id)
+    if cached is not None:
+        user_id, _ = cached
+        user = await db.get(User, user_id)
+
+    if user is None:
+        result = await db.execute(
+            _USER_BY_SUPABASE_ID, {"supabase_id": current_user.id}
+        )
+        user = result.scalar_one_or_none()
+
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found in database",
         )
-    
+
+    _user_lookup_cache[current_user.id] = (user.id, user.is_active)
+
     if not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Inactive user",
         )
-    
+
     return user
 
 
+@lru_cache(maxsize=1)
 def get_openai_service() -> OpenAIService:
     """
-    Get OpenAI service instance.
-    
-    This dependency provides an instance of the OpenAI service.
-    
+    Get the process-wide OpenAI service instance.
+
+    This dependency provides the shared OpenAI service. The instance is cached
+    for the lifetime of the process so the underlying HTTP client and its
+    connection pool are created once, not per request.
+
     Returns:
         OpenAIService: OpenAI service instance
     """
-    return OpenAIService(api_key=settings.openai_api_key)
+    return OpenAIService()
 
 
+@lru_cache(maxsize=1)
 def get_storage_service() -> StorageService:
     """
-    Get storage service instance.
-    
-    This dependency provides an instance of the storage service.
-    
+    Get the process-wide storage service instance.
+
+    This dependency provides the shared storage service. The instance is cached
+    for the lifetime of the process so the S3 client and its connection pool
+    are created once, not per request.
+
     Returns:
         StorageService: Storage service instance
     """
-    return StorageService(
-        storage_type=settings.storage_type,
-        aws_access_key_id=settings.aws_access_key_id,
-        aws_secret_access_key=settings.aws_secret_access_key,
-        aws_region=settings.aws_region,
-        aws_bucket_name=settings.aws_bucket_name,
-        supabase_url=settings.supabase_url,
-        supabase_key=settings.supabase_anon_key,
-        supabase_bucket=settings.supabase_storage_bucket,
-    )
+    return StorageService()
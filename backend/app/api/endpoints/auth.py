@@ -3,22 +3,28 @@ Authentication endpoints for the application.
 
 This module defines the API endpoints for user authentication.
 """
+import base64
 import secrets
+import uuid
+from collections import deque
 from typing import Any, Dict, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
-from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
+from fastapi.security import OAuth2PasswordRequestForm
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import bindparam, insert, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.deps import get_current_user
 from app.core.config import settings
 from app.core.logging import get_logger
 from app.core.security import (
     create_access_token,
     create_refresh_token,
-    get_password_hash,
-    verify_password,
+    get_password_hash_async,
+    password_needs_rehash,
+    verify_password_async,
     verify_token,
 )
 from app.db.session import get_db
@@ -33,9 +39,29 @@ from app.services.google_auth import (
 logger = get_logger(__name__)
 router = APIRouter()
 
-# OAuth2 password bearer for token authentication
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
+# Pre-generated pool of OAuth state tokens. Refilling in one bulk entropy
+# draw amortizes the per-request urandom syscall on /google/auth-url.
+_STATE_POOL: deque = deque()
+_STATE_POOL_BATCH = 256
 
+# The OAuth callback target never changes after startup; format it once
+_GOOGLE_REDIRECT_URI = f"{settings.FRONTEND_URL}/auth/callback"
+
+
+def _next_state_token() -> str:
+    """Return a cryptographically random state token from the pool."""
+    if not _STATE_POOL:
+        raw = secrets.token_bytes(32 * _STATE_POOL_BATCH)
+        _STATE_POOL.extend(
+            base64.urlsafe_b64encode(raw[i : i + 32]).rstrip(b"=").decode("ascii")
+            for i in range(0, len(raw), 32)
+        )
+    return _STATE_POOL.popleft()
+
+
+# Pre-built statement for the hot email lookup; built once at import so each
+# request only binds parameters instead of re-entering the SQL compiler.
+_USER_BY_EMAIL = select(User).where(User.email == bindparam("email")).limit(1)
 
 # Token response model
 class Token(BaseModel):
@@ -55,51 +81,6 @@ class RefreshTokenRequest(BaseModel):
     refresh_token: str
 
 
-async def get_current_user(
-    db: AsyncSession = Depends(get_db),
-    token: str = Depends(oauth2_scheme),
-) -> User:
-    """
-    Get the current authenticated user from the JWT token.
-    
-    Args:
-        db: Database session
-        token: JWT token
-        
-    Returns:
-        User: Current authenticated user
-        
-    Raises:
-        HTTPException: If token is invalid or user not found
-    """
-    payload = verify_token(token)
-    if not payload:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
-    user_id = payload.get("sub")
-    if not user_id:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token payload",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalars().first()
-    
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found",
-        )
-    
-    return user
-
-
 @router.post("/register", response_model=Token)
 async def register_user(
     user_data: UserCreate,
@@ -120,32 +101,32 @@ async def register_user(
     """
     logger.info(f"Registering user with email: {user_data.email}")
     
-    # Check if user already exists
-    result = await db.execute(
-        select(User).where(User.email == user_data.email)
-    )
-    existing_user = result.scalars().first()
-    
-    if existing_user:
+    # Create new user in a single INSERT ... RETURNING round-trip, relying on
+    # the unique index on email instead of a separate existence check; this
+    # also closes the check-then-insert race under concurrent registration.
+    # Hashing runs in a worker thread so it doesn't block the event loop.
+    hashed_password = await get_password_hash_async(user_data.password)
+    try:
+        result = await db.execute(
+            insert(User)
+            .values(
+                email=user_data.email,
+                hashed_password=hashed_password,
+                full_name=user_data.full_name or "",
+                auth_provider="email",
+            )
+            .returning(User)
+        )
+        new_user = result.scalar_one()
+    except IntegrityError:
+        # The request-scoped transaction in get_db rolls back when the
+        # HTTPException propagates through it.
         logger.warning(f"User already exists with email: {user_data.email}")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered",
         )
     
-    # Create new user
-    hashed_password = get_password_hash(user_data.password)
-    new_user = User(
-        email=user_data.email,
-        hashed_password=hashed_password,
-        full_name=user_data.full_name or "",
-        auth_provider="email",
-    )
-    
-    db.add(new_user)
-    await db.commit()
-    await db.refresh(new_user)
-    
     logger.info(f"User registered successfully with ID: {new_user.id}")
     
     # Create tokens
@@ -179,21 +160,26 @@ async def login(
     """
     logger.info(f"Login attempt for user: {form_data.username}")
     
-    # Find user by email
-    result = await db.execute(
-        select(User).where(User.email == form_data.username)
-    )
-    user = result.scalars().first()
+    # Find user by email (pre-compiled statement, parameters bound per call)
+    result = await db.execute(_USER_BY_EMAIL, {"email": form_data.username})
+    user = result.scalar_one_or_none()
     
-    # Verify user and password
-    if not user or not verify_password(form_data.password, user.hashed_password or ""):
+    # Verify user and password (bcrypt runs in a worker thread)
+    if not user or not await verify_password_async(
+        form_data.password, user.hashed_password or ""
+    ):
         logger.warning(f"Invalid login credentials for: {form_data.username}")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    
+
+    # Upgrade legacy bcrypt (or outdated-parameter) hashes now that the
+    # plaintext is available; the request transaction persists the change
+    if password_needs_rehash(user.hashed_password or ""):
+        user.hashed_password = await get_password_hash_async(form_data.password)
+
     # Create tokens
     access_token = create_access_token({"sub": str(user.id)})
     refresh_token = create_refresh_token({"sub": str(user.id)})
@@ -219,13 +205,10 @@ async def google_auth_url(request: Request) -> Dict[str, str]:
         Dict[str, str]: Authorization URL and state
     """
     # Generate state for CSRF protection
-    state = secrets.token_urlsafe(32)
-    
-    # Generate redirect URI based on the frontend URL
-    redirect_uri = f"{settings.frontend_url}/auth/callback"
+    state = _next_state_token()
     
-    # Get Google auth URL
-    auth_url = await get_google_auth_url(redirect_uri, state)
+    # Get Google auth URL (pure string formatting, no awaits)
+    auth_url = get_google_auth_url(_GOOGLE_REDIRECT_URI, state)
     
     return {
         "auth_url": auth_url,
@@ -258,32 +241,30 @@ async def google_callback(
         # Get user info from Google
         user_info = await get_google_user_info(token_data["access_token"])
         
-        # Check if user exists
-        result = await db.execute(
-            select(User).where(User.email == user_info["email"])
-        )
-        user = result.scalars().first()
+        # Check if user exists (pre-compiled statement)
+        result = await db.execute(_USER_BY_EMAIL, {"email": user_info["email"]})
+        user = result.scalar_one_or_none()
         
         if not user:
-            # Create new user
-            user = User(
-                email=user_info["email"],
-                full_name=user_info.get("name", ""),
-                auth_provider="google",
-                google_id=user_info["sub"],
+            # Create new user in a single INSERT ... RETURNING round-trip
+            result = await db.execute(
+                insert(User)
+                .values(
+                    email=user_info["email"],
+                    full_name=user_info.get("name", ""),
+                    auth_provider="google",
+                    google_id=user_info["sub"],
+                )
+                .returning(User)
             )
-            
-            db.add(user)
-            await db.commit()
-            await db.refresh(user)
-            
+            user = result.scalar_one()
+
             logger.info(f"New Google user created: {user.email}")
         else:
             # Update existing user's Google ID if not set
             if not user.google_id:
                 user.google_id = user_info["sub"]
                 user.auth_provider = "google"
-                await db.commit()
                 logger.info(f"Updated Google ID for user: {user.email}")
         
         # Create tokens
@@ -335,10 +316,17 @@ async def refresh_token(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token payload",
         )
-    
-    # Verify user exists
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalars().first()
+
+    try:
+        user_uuid = uuid.UUID(user_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token payload",
+        )
+
+    # Verify user exists (primary-key lookup via the identity map)
+    user = await db.get(User, user_uuid)
     
     if not user:
         raise HTTPException(
@@ -370,4 +358,5 @@ async def get_current_user_info(
     Returns:
         UserResponse: Current user data
     """
-    return current_user
+    # The row came straight from the database; skip re-validation
+    return UserResponse.from_orm_trusted(current_user)
@@ -3,20 +3,38 @@ Property management endpoints for the application.
 
 This module defines the API endpoints for property management.
 """
-from typing import Any, List, Optional
+import os
+import uuid
+from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
-from sqlalchemy import func, select
+import orjson
+from cachetools import TTLCache
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    Response,
+    status,
+)
+from sqlalchemy import func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import raiseload, selectinload
 
 from app.core.logging import get_logger
-from app.db.session import get_db
+from app.db.session import AsyncSessionLocal, get_db
 from app.models.property import Property
 from app.models.property_image import PropertyImage
 from app.models.user import User
 from app.schemas.property import PropertyCreate, PropertyResponse, PropertyUpdate
-from app.schemas.property_image import PropertyImageCreate, PropertyImageResponse
+from app.schemas.property_image import PropertyImageRegister, PropertyImageResponse
+from app.api.deps import (
+    get_current_active_user,
+    get_openai_service,
+    get_storage_service,
+)
+from app.api.pagination import decode_cursor, keyset_filter, next_cursor
 from app.services.openai_service import OpenAIService
 from app.services.storage import StorageService
 from app.services.supabase import SupabaseUser, get_current_user
@@ -24,12 +42,92 @@ from app.services.supabase import SupabaseUser, get_current_user
 logger = get_logger(__name__)
 router = APIRouter()
 
+# Short-TTL response caches for the read-heavy property endpoints. Entries are
+# pre-serialized JSON bytes, so hits skip the DB round trip and Pydantic
+# serialization entirely. Only published-property responses are cached (they
+# are identical for every caller); mutations invalidate below.
+_PROPERTY_CACHE_TTL = 300
+_property_cache: TTLCache = TTLCache(maxsize=2048, ttl=_PROPERTY_CACHE_TTL)
+_property_list_cache: TTLCache = TTLCache(maxsize=512, ttl=_PROPERTY_CACHE_TTL)
+
+
+def _invalidate_property_cache(property_id: Any = None) -> None:
+    """Drop cached responses after a property mutation."""
+    if property_id is not None:
+        _property_cache.pop(str(property_id), None)
+    # Any mutation can change which rows a filtered list returns
+    _property_list_cache.clear()
+
+
+def _coerce_property_id(property_id: str) -> uuid.UUID:
+    """Parse a property id path param, treating malformed values as 404.
+
+    The id columns are native UUIDs, so binding the raw string would fail at
+    the driver on character-based dialects; a value that cannot parse can
+    never match a row anyway.
+    """
+    try:
+        return uuid.UUID(property_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Property not found",
+        )
+
+
+# Field names resolved once from the response schema; the hot read paths
+# serialize plain dicts shaped like PropertyResponse instead of paying for
+# model construction and validation on trusted rows
+_PROPERTY_RESPONSE_FIELDS = tuple(PropertyResponse.model_fields)
+
+
+def _property_dict(prop: Any) -> Dict[str, Any]:
+    """Shape a Property row (ORM instance or Core Row) for serialization.
+
+    Trusted DB data goes straight into a plain dict — no Pydantic model is
+    built at all; orjson encodes the UUID/datetime values natively.
+    """
+    return {name: getattr(prop, name, None) for name in _PROPERTY_RESPONSE_FIELDS}
+
+
+def _json_response(body: bytes, cursor: Optional[str] = None) -> Response:
+    """Return pre-serialized JSON bytes as a response."""
+    headers = {"X-Next-Cursor": cursor} if cursor else None
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def _generate_and_store_description(
+    image_id: Any, url: str, openai_service: OpenAIService
+) -> None:
+    """
+    Generate an AI description for an uploaded image and persist it.
+
+    Runs as a background task after the upload response has been sent, so the
+    multi-second OpenAI call never sits on the request's critical path.
+    """
+    try:
+        description = await openai_service.generate_image_description(url)
+    except Exception as e:
+        logger.error("Error generating AI description for image %s: %s", image_id, e)
+        return
+
+    if not description:
+        return
+
+    async with AsyncSessionLocal() as session:
+        async with session.begin():
+            await session.execute(
+                update(PropertyImage)
+                .where(PropertyImage.id == image_id)
+                .values(ai_generated_description=description)
+            )
+
 
 @router.post("/", response_model=PropertyResponse)
 async def create_property(
     property_data: PropertyCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: SupabaseUser = Depends(get_current_user),
+    db_user: User = Depends(get_current_active_user),
 ) -> Any:
     """
     Create a new property.
@@ -39,45 +137,34 @@ async def create_property(
     Args:
         property_data: Property data
         db: Database session
-        current_user: Current authenticated Supabase user
+        db_user: Current active user
         
     Returns:
         PropertyResponse: Created property data
     """
-    logger.info(f"Creating property for user: {current_user.id}")
-    
-    # Get user from database
+    logger.info("Creating property for user: %s", db_user.id)
+
+    # Create new property in a single INSERT ... RETURNING round trip; the
+    # returned row already carries the server-generated defaults, so no
+    # follow-up refresh SELECT is needed
     result = await db.execute(
-        select(User).where(User.supabase_id == current_user.id)
-    )
-    db_user = result.scalars().first()
-    
-    if not db_user:
-        logger.warning(f"User not found in database for Supabase ID: {current_user.id}")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found in database",
-        )
-    
-    # Create new property
-    new_property = Property(
-        **property_data.model_dump(),
-        user_id=db_user.id,
+        insert(Property)
+        .values(**property_data.model_dump(), user_id=db_user.id)
+        .returning(Property)
     )
-    
-    db.add(new_property)
-    await db.commit()
-    await db.refresh(new_property)
-    
-    logger.info(f"Property created successfully: {new_property.id}")
+    new_property = result.scalar_one()
+
+    _invalidate_property_cache()
+
+    logger.info("Property created successfully: %s", new_property.id)
     
     return new_property
 
 
 @router.get("/", response_model=List[PropertyResponse])
 async def get_properties(
-    skip: int = 0,
-    limit: int = 20,
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
     category: Optional[str] = None,
     min_price: Optional[float] = None,
     max_price: Optional[float] = None,
@@ -95,7 +182,7 @@ async def get_properties(
     This endpoint returns a list of properties with optional filtering.
     
     Args:
-        skip: Number of properties to skip
+        cursor: Opaque keyset cursor from the previous page's X-Next-Cursor
         limit: Maximum number of properties to return
         category: Filter by property category
         min_price: Filter by minimum price
@@ -109,13 +196,46 @@ async def get_properties(
         current_user: Current authenticated Supabase user (optional)
         
     Returns:
-        List[PropertyResponse]: List of properties
+        List[PropertyResponse]: List of properties; the X-Next-Cursor response
+        header carries the cursor for the following page
     """
     logger.info("Getting properties with filters")
-    
-    # Build query
-    query = select(Property).options(
-        joinedload(Property.images)
+
+    cache_key = (
+        cursor, limit, category, min_price, max_price,
+        bedrooms, bathrooms, city, state, search,
+    )
+    cached = _property_list_cache.get(cache_key)
+    if cached is not None:
+        return _json_response(*cached)
+
+    # Compute the two image scalars in SQL instead of loading every image row
+    # for every property: a correlated count and the primary image URL. This
+    # keeps the transferred payload at one row per property.
+    image_count = (
+        select(func.count(PropertyImage.id))
+        .where(PropertyImage.property_id == Property.id)
+        .correlate(Property)
+        .scalar_subquery()
+    )
+    primary_image_url = (
+        select(PropertyImage.url)
+        .where(
+            (PropertyImage.property_id == Property.id)
+            & (PropertyImage.is_primary == True)
+        )
+        .limit(1)
+        .correlate(Property)
+        .scalar_subquery()
+    )
+
+    # Select plain columns rather than the ORM entity: the list path never
+    # mutates rows, so lightweight Row tuples skip instrumented-attribute
+    # and identity-map overhead on every row
+    query = select(
+        *Property.__table__.c,
+        primary_image_url.label("primary_image_url"),
+        image_count.label("image_count"),
     ).where(Property.is_published == True)
     
     # Apply filters
@@ -139,20 +259,29 @@ async def get_properties(
             (Property.description.ilike(f"%{search}%"))
         )
     
-    # Apply pagination
-    query = query.offset(skip).limit(limit)
+    # Apply keyset pagination: constant cost per page, unlike OFFSET which
+    # walks and discards `skip` rows server-side
+    if cursor:
+        cursor_ts, cursor_id = decode_cursor(cursor)
+        query = query.where(
+            keyset_filter(Property.created_at, Property.id, cursor_ts, cursor_id)
+        )
+    query = query.order_by(
+        Property.created_at.desc(), Property.id.desc()
+    ).limit(limit)
     
-    # Execute query
+    # Each Row already carries the property columns plus the two computed
+    # scalars under their labels, so no per-row attribute patching is needed
     result = await db.execute(query)
-    properties = result.unique().scalars().all()
-    
-    # Add image count and primary image URL to each property
-    for prop in properties:
-        primary_image = next((img for img in prop.images if img.is_primary), None)
-        prop.primary_image_url = primary_image.url if primary_image else None
-        prop.image_count = len(prop.images)
-    
-    return properties
+    rows = result.all()
+
+    page_cursor = next_cursor(rows, limit)
+
+    # Serialize once, cache the bytes, and serve those bytes directly
+    body = orjson.dumps([_property_dict(row) for row in rows])
+    _property_list_cache[cache_key] = (body, page_cursor)
+
+    return _json_response(body, page_cursor)
 
 
 @router.get("/{property_id}", response_model=PropertyResponse)
@@ -177,51 +306,59 @@ async def get_property(
     Raises:
         HTTPException: If property not found
     """
-    logger.info(f"Getting property with ID: {property_id}")
-    
-    # Get property with images
-    result = await db.execute(
+    logger.info("Getting property with ID: %s", property_id)
+    property_uuid = _coerce_property_id(property_id)
+
+    cached = _property_cache.get(property_id)
+    if cached is not None:
+        return _json_response(cached)
+
+    # Get property with images; when a caller is authenticated, resolve their
+    # user id in the same round trip via an outer join instead of a second
+    # SELECT on the unpublished-property path. selectinload avoids the
+    # row-multiplying join of joinedload, and raiseload fails fast on any
+    # accidental lazy load of other relationships.
+    query = (
         select(Property)
-        .options(joinedload(Property.images))
-        .where(Property.id == property_id)
+        .options(selectinload(Property.images), raiseload("*"))
+        .where(Property.id == property_uuid)
     )
-    property = result.unique().scalars().first()
-    
+    if current_user:
+        query = query.add_columns(User.id).outerjoin(
+            User, User.supabase_id == current_user.id
+        )
+
+    row = (await db.execute(query)).first()
+    property = row[0] if row else None
+    caller_user_id = row[1] if row and current_user else None
+
     if not property:
-        logger.warning(f"Property not found with ID: {property_id}")
+        logger.warning("Property not found with ID: %s", property_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Property not found",
         )
-    
+
     # Check if property is published or belongs to current user
-    if not property.is_published:
-        if not current_user:
-            logger.warning(f"Unauthorized access to unpublished property: {property_id}")
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Property is not published",
-            )
-        
-        # Get user from database
-        user_result = await db.execute(
-            select(User).where(User.supabase_id == current_user.id)
+    if not property.is_published and property.user_id != caller_user_id:
+        logger.warning("Unauthorized access to unpublished property: %s", property_id)
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Property is not published",
         )
-        db_user = user_result.scalars().first()
-        
-        if not db_user or property.user_id != db_user.id:
-            logger.warning(f"Unauthorized access to unpublished property: {property_id}")
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Property is not published",
-            )
     
     # Add image count and primary image URL
     primary_image = next((img for img in property.images if img.is_primary), None)
     property.primary_image_url = primary_image.url if primary_image else None
     property.image_count = len(property.images)
-    
-    return property
+
+    body = orjson.dumps(_property_dict(property))
+    # Published responses are identical for every caller, so they are safe to
+    # share; unpublished ones are owner-only and stay uncached
+    if property.is_published:
+        _property_cache[property_id] = body
+
+    return _json_response(body)
 
 
 @router.put("/{property_id}", response_model=PropertyResponse)
@@ -229,7 +366,7 @@ async def update_property(
     property_id: str,
     property_data: PropertyUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: SupabaseUser = Depends(get_current_user),
+    db_user: User = Depends(get_current_active_user),
 ) -> Any:
     """
     Update property.
@@ -240,7 +377,7 @@ async def update_property(
         property_id: Property ID
         property_data: Updated property data
         db: Database session
-        current_user: Current authenticated Supabase user
+        db_user: Current active user
         
     Returns:
         PropertyResponse: Updated property data
@@ -248,29 +385,14 @@ async def update_property(
     Raises:
         HTTPException: If property not found or update fails
     """
-    logger.info(f"Updating property with ID: {property_id}")
+    logger.info("Updating property with ID: %s", property_id)
+    property_uuid = _coerce_property_id(property_id)
     
-    # Get user from database
-    user_result = await db.execute(
-        select(User).where(User.supabase_id == current_user.id)
-    )
-    db_user = user_result.scalars().first()
-    
-    if not db_user:
-        logger.warning(f"User not found in database for Supabase ID: {current_user.id}")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found in database",
-        )
-    
-    # Get property
-    result = await db.execute(
-        select(Property).where(Property.id == property_id)
-    )
-    property = result.scalars().first()
+    # Get property (db.scalar skips the Result/ScalarResult wrappers)
+    property = await db.scalar(select(Property).where(Property.id == property_uuid))
     
     if not property:
-        logger.warning(f"Property not found with ID: {property_id}")
+        logger.warning("Property not found with ID: %s", property_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Property not found",
@@ -278,7 +400,7 @@ async def update_property(
     
     # Check if property belongs to current user
     if property.user_id != db_user.id:
-        logger.warning(f"Unauthorized update attempt for property: {property_id}")
+        logger.warning("Unauthorized update attempt for property: %s", property_id)
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to update this property",
@@ -289,10 +411,12 @@ async def update_property(
     for field, value in update_data.items():
         setattr(property, field, value)
     
-    await db.commit()
+    await db.flush()
     await db.refresh(property)
-    
-    logger.info(f"Property updated successfully: {property.id}")
+
+    _invalidate_property_cache(property_id)
+
+    logger.info("Property updated successfully: %s", property.id)
     
     return property
 
@@ -301,8 +425,8 @@ async def update_property(
 async def delete_property(
     property_id: str,
     db: AsyncSession = Depends(get_db),
-    current_user: SupabaseUser = Depends(get_current_user),
-) -> Any:
+    db_user: User = Depends(get_current_active_user),
+) -> None:
     """
     Delete property.
     
@@ -311,34 +435,76 @@ async def delete_property(
     Args:
         property_id: Property ID
         db: Database session
-        current_user: Current authenticated Supabase user
+        db_user: Current active user
         
     Raises:
         HTTPException: If property not found or delete fails
     """
-    logger.info(f"Deleting property with ID: {property_id}")
+    logger.info("Deleting property with ID: %s", property_id)
+    property_uuid = _coerce_property_id(property_id)
     
-    # Get user from database
-    user_result = await db.execute(
-        select(User).where(User.supabase_id == current_user.id)
-    )
-    db_user = user_result.scalars().first()
+    # Get property (db.scalar skips the Result/ScalarResult wrappers)
+    property = await db.scalar(select(Property).where(Property.id == property_uuid))
     
-    if not db_user:
-        logger.warning(f"User not found in database for Supabase ID: {current_user.id}")
+    if not property:
+        logger.warning("Property not found with ID: %s", property_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found in database",
+            detail="Property not found",
         )
     
-    # Get property
-    result = await db.execute(
-        select(Property).where(Property.id == property_id)
-    )
-    property = result.scalars().first()
+    # Check if property belongs to current user
+    if property.user_id != db_user.id:
+        logger.warning("Unauthorized delete attempt for property: %s", property_id)
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to delete this property",
+        )
+    
+    # Delete property (flushed and committed by the request transaction)
+    await db.delete(property)
+
+    _invalidate_property_cache(property_id)
+
+    logger.info("Property deleted successfully: %s", property_id)
+
+
+@router.post("/{property_id}/images/presign", response_model=Dict[str, Any])
+async def presign_property_image(
+    property_id: str,
+    filename: str,
+    db: AsyncSession = Depends(get_db),
+    db_user: User = Depends(get_current_active_user),
+    storage_service: StorageService = Depends(get_storage_service),
+) -> Any:
+    """
+    Create a pre-signed upload for a property image.
+    
+    The client POSTs the file straight to storage with the returned form and
+    then registers it via the images endpoint, so the file bytes never flow
+    through an API worker.
+    
+    Args:
+        property_id: Property ID
+        filename: Original filename (its extension is preserved)
+        db: Database session
+        db_user: Current active user
+        storage_service: Storage service issuing the signature
+        
+    Returns:
+        Dict[str, Any]: Upload URL, form fields, and the storage path
+        
+    Raises:
+        HTTPException: If property not found or not owned by the caller
+    """
+    logger.info("Presigning image upload for property: %s", property_id)
+    property_uuid = _coerce_property_id(property_id)
+    
+    # Get property (db.scalar skips the Result/ScalarResult wrappers)
+    property = await db.scalar(select(Property).where(Property.id == property_uuid))
     
     if not property:
-        logger.warning(f"Property not found with ID: {property_id}")
+        logger.warning("Property not found with ID: %s", property_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Property not found",
@@ -346,74 +512,63 @@ async def delete_property(
     
     # Check if property belongs to current user
     if property.user_id != db_user.id:
-        logger.warning(f"Unauthorized delete attempt for property: {property_id}")
+        logger.warning("Unauthorized image upload for property: %s", property_id)
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to delete this property",
+            detail="Not authorized to upload images for this property",
         )
     
-    # Delete property
-    await db.delete(property)
-    await db.commit()
+    # Unique destination path preserving the file extension
+    _, ext = os.path.splitext(filename)
+    storage_path = f"properties/{property_id}/{uuid.uuid4()}{ext}"
+    presigned = storage_service.presign_upload(storage_path)
     
-    logger.info(f"Property deleted successfully: {property_id}")
+    return {
+        "url": presigned["url"],
+        "fields": presigned["fields"],
+        "storage_path": storage_path,
+    }
 
 
 @router.post("/{property_id}/images", response_model=PropertyImageResponse)
 async def upload_property_image(
     property_id: str,
-    caption: Optional[str] = None,
-    is_primary: bool = False,
-    file: UploadFile = File(...),
+    image_data: PropertyImageRegister,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
-    current_user: SupabaseUser = Depends(get_current_user),
-    storage_service: StorageService = Depends(StorageService),
-    openai_service: OpenAIService = Depends(OpenAIService),
+    db_user: User = Depends(get_current_active_user),
+    storage_service: StorageService = Depends(get_storage_service),
+    openai_service: OpenAIService = Depends(get_openai_service),
 ) -> Any:
     """
-    Upload property image.
+    Register a property image uploaded via a pre-signed URL.
     
-    This endpoint uploads an image for a property.
+    This endpoint records an image that the client already uploaded directly
+    to storage, so the API worker never proxies the file bytes.
     
     Args:
         property_id: Property ID
-        caption: Optional image caption
-        is_primary: Whether this is the primary image
-        file: Image file
+        image_data: Storage path from the presign endpoint plus image metadata
+        background_tasks: FastAPI background task queue
         db: Database session
-        current_user: Current authenticated Supabase user
-        storage_service: Storage service for file uploads
+        db_user: Current active user
+        storage_service: Storage service for existence checks
         openai_service: OpenAI service for generating image descriptions
         
     Returns:
-        PropertyImageResponse: Uploaded image data
+        PropertyImageResponse: Registered image data
         
     Raises:
-        HTTPException: If property not found or upload fails
+        HTTPException: If property not found or the file is missing in storage
     """
-    logger.info(f"Uploading image for property: {property_id}")
-    
-    # Get user from database
-    user_result = await db.execute(
-        select(User).where(User.supabase_id == current_user.id)
-    )
-    db_user = user_result.scalars().first()
-    
-    if not db_user:
-        logger.warning(f"User not found in database for Supabase ID: {current_user.id}")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found in database",
-        )
+    logger.info("Registering image for property: %s", property_id)
+    property_uuid = _coerce_property_id(property_id)
     
-    # Get property
-    result = await db.execute(
-        select(Property).where(Property.id == property_id)
-    )
-    property = result.scalars().first()
+    # Get property (db.scalar skips the Result/ScalarResult wrappers)
+    property = await db.scalar(select(Property).where(Property.id == property_uuid))
     
     if not property:
-        logger.warning(f"Property not found with ID: {property_id}")
+        logger.warning("Property not found with ID: %s", property_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Property not found",
@@ -421,50 +576,56 @@ async def upload_property_image(
     
     # Check if property belongs to current user
     if property.user_id != db_user.id:
-        logger.warning(f"Unauthorized image upload for property: {property_id}")
+        logger.warning("Unauthorized image upload for property: %s", property_id)
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to upload images for this property",
         )
     
-    # Upload file to storage
-    storage_path = f"properties/{property_id}/{file.filename}"
-    url = await storage_service.upload_file(file, storage_path)
-    
-    # Generate AI description of the image
-    try:
-        ai_description = await openai_service.generate_image_description(url)
-    except Exception as e:
-        logger.error(f"Error generating AI description: {str(e)}")
-        ai_description = None
-    
-    # If this is the primary image, update all other images
-    if is_primary:
-        # Get all property images
-        images_result = await db.execute(
-            select(PropertyImage).where(PropertyImage.property_id == property_id)
+    # Verify the client actually completed the direct upload
+    storage_path = image_data.storage_path
+    if not await storage_service.file_exists(storage_path):
+        logger.warning("Registered image missing in storage: %s", storage_path)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Uploaded file not found in storage",
         )
-        existing_images = images_result.scalars().all()
-        
-        # Set all to non-primary
-        for img in existing_images:
-            img.is_primary = False
-    
-    # Create new property image
-    new_image = PropertyImage(
-        property_id=property_id,
-        storage_path=storage_path,
-        url=url,
-        caption=caption,
-        is_primary=is_primary,
-        ai_generated_description=ai_description,
-    )
     
-    db.add(new_image)
-    await db.commit()
-    await db.refresh(new_image)
+    url = storage_service.public_url(storage_path)
     
-    logger.info(f"Image uploaded successfully: {new_image.id}")
+    # If this is the primary image, demote all other images in one bulk
+    # UPDATE instead of loading and flipping each row in Python
+    if image_data.is_primary:
+        await db.execute(
+            update(PropertyImage)
+            .where(PropertyImage.property_id == property_uuid)
+            .values(is_primary=False)
+        )
+    
+    # Create new property image in a single INSERT ... RETURNING round trip
+    result = await db.execute(
+        insert(PropertyImage)
+        .values(
+            property_id=property_uuid,
+            storage_path=storage_path,
+            url=url,
+            caption=image_data.caption,
+            is_primary=image_data.is_primary,
+        )
+        .returning(PropertyImage)
+    )
+    new_image = result.scalar_one()
+
+    # Image count / primary image feed the cached property payloads
+    _invalidate_property_cache(property_id)
+
+    # Generate the AI description after the response is sent; it is not
+    # required for the upload to succeed
+    background_tasks.add_task(
+        _generate_and_store_description, new_image.id, url, openai_service
+    )
+
+    logger.info("Image uploaded successfully: %s", new_image.id)
     
     return new_image
 
@@ -491,40 +652,40 @@ async def get_property_images(
     Raises:
         HTTPException: If property not found
     """
-    logger.info(f"Getting images for property: {property_id}")
-    
-    # Get property
-    property_result = await db.execute(
-        select(Property).where(Property.id == property_id)
-    )
-    property = property_result.scalars().first()
-    
+    logger.info("Getting images for property: %s", property_id)
+    property_uuid = _coerce_property_id(property_id)
+    
+    # Get property; resolve the caller's user id in the same round trip via an
+    # outer join instead of a second SELECT on the unpublished-property path
+    query = select(Property).options(raiseload("*")).where(Property.id == property_uuid)
+    if current_user:
+        query = query.add_columns(User.id).outerjoin(
+            User, User.supabase_id == current_user.id
+        )
+
+    row = (await db.execute(query)).first()
+    property = row[0] if row else None
+    caller_user_id = row[1] if row and current_user else None
+
     if not property:
-        logger.warning(f"Property not found with ID: {property_id}")
+        logger.warning("Property not found with ID: %s", property_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Property not found",
         )
-    
+
     # Check if property is published or belongs to current user
-    if not property.is_published and current_user:
-        # Get user from database
-        user_result = await db.execute(
-            select(User).where(User.supabase_id == current_user.id)
+    if not property.is_published and current_user and property.user_id != caller_user_id:
+        logger.warning("Unauthorized access to unpublished property images: %s", property_id)
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Property is not published",
         )
-        db_user = user_result.scalars().first()
-        
-        if not db_user or property.user_id != db_user.id:
-            logger.warning(f"Unauthorized access to unpublished property images: {property_id}")
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Property is not published",
-            )
     
     # Get images
     result = await db.execute(
         select(PropertyImage)
-        .where(PropertyImage.property_id == property_id)
+        .where(PropertyImage.property_id == property_uuid)
         .order_by(PropertyImage.is_primary.desc(), PropertyImage.created_at)
     )
     images = result.scalars().all()
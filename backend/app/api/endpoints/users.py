@@ -3,12 +3,16 @@ User management endpoints for the application.
 
 This module defines the API endpoints for user management.
 """
-from typing import Any, List
+import uuid
+from typing import Any, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
+from app.api.deps import invalidate_user_lookup
+from app.api.pagination import decode_cursor, keyset_filter, next_cursor
 from app.core.logging import get_logger
 from app.db.session import get_db
 from app.models.user import User
@@ -18,11 +22,34 @@ from app.services.supabase import SupabaseUser, get_current_user
 logger = get_logger(__name__)
 router = APIRouter()
 
+# Only the columns UserResponse serializes; keeps hashed_password and the
+# provider ids out of the SELECT list and off the wire
+_USER_RESPONSE_COLUMNS = load_only(
+    User.id,
+    User.email,
+    User.full_name,
+    User.supabase_id,
+    User.is_active,
+    User.created_at,
+    User.updated_at,
+)
+
+# Pre-built statements for the by-id lookups; built once at import so each
+# request only binds parameters instead of re-entering the SQL compiler.
+_USER_BY_ID = (
+    select(User)
+    .options(_USER_RESPONSE_COLUMNS)
+    .where(User.id == bindparam("user_id"))
+    .limit(1)
+)
+_USER_BY_ID_FULL = select(User).where(User.id == bindparam("user_id")).limit(1)
+
 
 @router.get("/", response_model=List[UserResponse])
 async def get_users(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
     db: AsyncSession = Depends(get_db),
     current_user: SupabaseUser = Depends(get_current_user),
 ) -> Any:
@@ -32,25 +59,40 @@ async def get_users(
     This endpoint returns a list of users with pagination.
     
     Args:
-        skip: Number of users to skip
+        response: Response object used to expose the next-page cursor
+        cursor: Opaque keyset cursor from the previous page's X-Next-Cursor
         limit: Maximum number of users to return
         db: Database session
         current_user: Current authenticated Supabase user
         
     Returns:
-        List[UserResponse]: List of users
+        List[UserResponse]: List of users; the X-Next-Cursor response header
+        carries the cursor for the following page
     """
-    logger.info(f"Getting users list (skip={skip}, limit={limit})")
-    
-    result = await db.execute(select(User).offset(skip).limit(limit))
+    logger.info("Getting users list (cursor=%s, limit=%s)", cursor, limit)
+
+    # Keyset pagination: constant cost per page, unlike OFFSET
+    query = select(User).options(_USER_RESPONSE_COLUMNS)
+    if cursor:
+        cursor_ts, cursor_id = decode_cursor(cursor)
+        query = query.where(
+            keyset_filter(User.created_at, User.id, cursor_ts, cursor_id)
+        )
+    query = query.order_by(User.created_at.desc(), User.id.desc()).limit(limit)
+
+    result = await db.execute(query)
     users = result.scalars().all()
-    
+
+    page_cursor = next_cursor(users, limit)
+    if page_cursor:
+        response.headers["X-Next-Cursor"] = page_cursor
+
     return users
 
 
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
-    user_id: str,
+    user_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
     current_user: SupabaseUser = Depends(get_current_user),
 ) -> Any:
@@ -70,13 +112,12 @@ async def get_user(
     Raises:
         HTTPException: If user not found
     """
-    logger.info(f"Getting user with ID: {user_id}")
+    logger.info("Getting user with ID: %s", user_id)
     
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalars().first()
+    user = await db.scalar(_USER_BY_ID, {"user_id": user_id})
     
     if not user:
-        logger.warning(f"User not found with ID: {user_id}")
+        logger.warning("User not found with ID: %s", user_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found",
@@ -87,7 +128,7 @@ async def get_user(
 
 @router.put("/{user_id}", response_model=UserResponse)
 async def update_user(
-    user_id: str,
+    user_id: uuid.UUID,
     user_data: UserUpdate,
     db: AsyncSession = Depends(get_db),
     current_user: SupabaseUser = Depends(get_current_user),
@@ -109,13 +150,12 @@ async def update_user(
     Raises:
         HTTPException: If user not found or update fails
     """
-    logger.info(f"Updating user with ID: {user_id}")
+    logger.info("Updating user with ID: %s", user_id)
     
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalars().first()
+    user = await db.scalar(_USER_BY_ID_FULL, {"user_id": user_id})
     
     if not user:
-        logger.warning(f"User not found with ID: {user_id}")
+        logger.warning("User not found with ID: %s", user_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found",
@@ -126,9 +166,12 @@ async def update_user(
     for field, value in update_data.items():
         setattr(user, field, value)
     
-    await db.commit()
+    await db.flush()
     await db.refresh(user)
-    
-    logger.info(f"User updated successfully: {user.id}")
+
+    # Drop the cached supabase_id -> user_id mapping so auth re-reads the row
+    invalidate_user_lookup(user.supabase_id)
+
+    logger.info("User updated successfully: %s", user.id)
     
     return user
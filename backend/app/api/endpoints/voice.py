@@ -6,7 +6,8 @@ This module defines the API endpoints for voice assistant functionality.
 from typing import Any, Dict, Optional
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
-from sqlalchemy import select
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.logging import get_logger
@@ -18,9 +19,13 @@ from app.schemas.voice_setting import (
     VoiceSettingResponse,
     VoiceSettingUpdate,
 )
+from app.api.deps import (
+    get_current_active_user,
+    get_openai_service,
+    get_storage_service,
+)
 from app.services.openai_service import OpenAIService
 from app.services.storage import StorageService
-from app.services.supabase import SupabaseUser, get_current_user
 
 logger = get_logger(__name__)
 router = APIRouter()
@@ -30,7 +35,7 @@ router = APIRouter()
 async def create_voice_settings(
     settings_data: VoiceSettingCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: SupabaseUser = Depends(get_current_user),
+    db_user: User = Depends(get_current_active_user),
 ) -> Any:
     """
     Create voice assistant settings.
@@ -40,47 +45,32 @@ async def create_voice_settings(
     Args:
         settings_data: Voice settings data
         db: Database session
-        current_user: Current authenticated Supabase user
+        db_user: Current active user
         
     Returns:
         VoiceSettingResponse: Created voice settings data
     """
-    logger.info(f"Creating voice settings for user: {current_user.id}")
-    
-    # Get user from database
-    result = await db.execute(
-        select(User).where(User.supabase_id == current_user.id)
-    )
-    db_user = result.scalars().first()
-    
-    if not db_user:
-        logger.warning(f"User not found in database for Supabase ID: {current_user.id}")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found in database",
+    logger.info("Creating voice settings for user: %s", db_user.id)
+
+    # Atomic get-or-create: attempt the INSERT under a savepoint and fall back
+    # to a SELECT when the unique index on user_id reports an existing row.
+    # One round trip in the common case, and no SELECT-then-INSERT race.
+    try:
+        async with db.begin_nested():
+            result = await db.execute(
+                insert(VoiceSetting)
+                .values(**settings_data.model_dump(), user_id=db_user.id)
+                .returning(VoiceSetting)
+            )
+            new_settings = result.scalar_one()
+    except IntegrityError:
+        existing_settings = await db.scalar(
+            select(VoiceSetting).where(VoiceSetting.user_id == db_user.id)
         )
-    
-    # Check if user already has voice settings
-    settings_result = await db.execute(
-        select(VoiceSetting).where(VoiceSetting.user_id == db_user.id)
-    )
-    existing_settings = settings_result.scalars().first()
-    
-    if existing_settings:
-        logger.info(f"User already has voice settings: {existing_settings.id}")
+        logger.info("User already has voice settings: %s", existing_settings.id)
         return existing_settings
-    
-    # Create new voice settings
-    new_settings = VoiceSetting(
-        **settings_data.model_dump(),
-        user_id=db_user.id,
-    )
-    
-    db.add(new_settings)
-    await db.commit()
-    await db.refresh(new_settings)
-    
-    logger.info(f"Voice settings created successfully: {new_settings.id}")
+
+    logger.info("Voice settings created successfully: %s", new_settings.id)
     
     return new_settings
 
@@ -88,7 +78,7 @@ async def create_voice_settings(
 @router.get("/settings", response_model=VoiceSettingResponse)
 async def get_voice_settings(
     db: AsyncSession = Depends(get_db),
-    current_user: SupabaseUser = Depends(get_current_user),
+    db_user: User = Depends(get_current_active_user),
 ) -> Any:
     """
     Get voice assistant settings.
@@ -97,7 +87,7 @@ async def get_voice_settings(
     
     Args:
         db: Database session
-        current_user: Current authenticated Supabase user
+        db_user: Current active user
         
     Returns:
         VoiceSettingResponse: Voice settings data
@@ -105,37 +95,32 @@ async def get_voice_settings(
     Raises:
         HTTPException: If settings not found
     """
-    logger.info(f"Getting voice settings for user: {current_user.id}")
-    
-    # Get user from database
-    user_result = await db.execute(
-        select(User).where(User.supabase_id == current_user.id)
-    )
-    db_user = user_result.scalars().first()
-    
-    if not db_user:
-        logger.warning(f"User not found in database for Supabase ID: {current_user.id}")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found in database",
-        )
+    logger.info("Getting voice settings for user: %s", db_user.id)
     
     # Get voice settings
-    result = await db.execute(
+    settings = await db.scalar(
         select(VoiceSetting).where(VoiceSetting.user_id == db_user.id)
     )
-    settings = result.scalars().first()
     
     if not settings:
-        logger.warning(f"Voice settings not found for user: {db_user.id}")
-        
-        # Create default settings
-        settings = VoiceSetting(user_id=db_user.id)
-        db.add(settings)
-        await db.commit()
-        await db.refresh(settings)
-        
-        logger.info(f"Default voice settings created: {settings.id}")
+        logger.warning("Voice settings not found for user: %s", db_user.id)
+        
+        # Create default settings; the savepoint guards against a concurrent
+        # request creating the row between the SELECT and the INSERT
+        try:
+            async with db.begin_nested():
+                result = await db.execute(
+                    insert(VoiceSetting)
+                    .values(user_id=db_user.id)
+                    .returning(VoiceSetting)
+                )
+                settings = result.scalar_one()
+        except IntegrityError:
+            settings = await db.scalar(
+                select(VoiceSetting).where(VoiceSetting.user_id == db_user.id)
+            )
+        
+        logger.info("Default voice settings created: %s", settings.id)
     
     return settings
 
@@ -144,7 +129,7 @@ async def get_voice_settings(
 async def update_voice_settings(
     settings_data: VoiceSettingUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: SupabaseUser = Depends(get_current_user),
+    db_user: User = Depends(get_current_active_user),
 ) -> Any:
     """
     Update voice assistant settings.
@@ -154,7 +139,7 @@ async def update_voice_settings(
     Args:
         settings_data: Updated voice settings data
         db: Database session
-        current_user: Current authenticated Supabase user
+        db_user: Current active user
         
     Returns:
         VoiceSettingResponse: Updated voice settings data
@@ -162,41 +147,25 @@ async def update_voice_settings(
     Raises:
         HTTPException: If settings not found or update fails
     """
-    logger.info(f"Updating voice settings for user: {current_user.id}")
-    
-    # Get user from database
-    user_result = await db.execute(
-        select(User).where(User.supabase_id == current_user.id)
-    )
-    db_user = user_result.scalars().first()
-    
-    if not db_user:
-        logger.warning(f"User not found in database for Supabase ID: {current_user.id}")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found in database",
-        )
+    logger.info("Updating voice settings for user: %s", db_user.id)
     
     # Get voice settings
-    result = await db.execute(
+    settings = await db.scalar(
         select(VoiceSetting).where(VoiceSetting.user_id == db_user.id)
     )
-    settings = result.scalars().first()
     
     if not settings:
-        logger.warning(f"Voice settings not found for user: {db_user.id}")
+        logger.warning("Voice settings not found for user: %s", db_user.id)
         
-        # Create new settings with provided data
-        new_settings = VoiceSetting(
-            **settings_data.model_dump(exclude_unset=True),
-            user_id=db_user.id,
+        # Create new settings with provided data in one INSERT ... RETURNING
+        result = await db.execute(
+            insert(VoiceSetting)
+            .values(**settings_data.model_dump(exclude_unset=True), user_id=db_user.id)
+            .returning(VoiceSetting)
         )
+        new_settings = result.scalar_one()
         
-        db.add(new_settings)
-        await db.commit()
-        await db.refresh(new_settings)
-        
-        logger.info(f"Voice settings created during update: {new_settings.id}")
+        logger.info("Voice settings created during update: %s", new_settings.id)
         
         return new_settings
     
@@ -205,10 +174,10 @@ async def update_voice_settings(
     for field, value in update_data.items():
         setattr(settings, field, value)
     
-    await db.commit()
+    await db.flush()
     await db.refresh(settings)
     
-    logger.info(f"Voice settings updated successfully: {settings.id}")
+    logger.info("Voice settings updated successfully: %s", settings.id)
     
     return settings
 
@@ -217,9 +186,9 @@ async def update_voice_settings(
 async def process_voice_command(
     file: UploadFile = File(...),
     db: AsyncSession = Depends(get_db),
-    current_user: SupabaseUser = Depends(get_current_user),
-    openai_service: OpenAIService = Depends(OpenAIService),
-    storage_service: StorageService = Depends(StorageService),
+    db_user: User = Depends(get_current_active_user),
+    openai_service: OpenAIService = Depends(get_openai_service),
+    storage_service: StorageService = Depends(get_storage_service),
 ) -> Any:
     """
     Process voice command.
@@ -229,7 +198,7 @@ async def process_voice_command(
     Args:
         file: Audio file containing the voice command
         db: Database session
-        current_user: Current authenticated Supabase user
+        db_user: Current active user
         openai_service: OpenAI service for processing voice commands
         storage_service: Storage service for file uploads
         
@@ -239,20 +208,7 @@ async def process_voice_command(
     Raises:
         HTTPException: If processing fails
     """
-    logger.info(f"Processing voice command for user: {current_user.id}")
-    
-    # Get user from database
-    user_result = await db.execute(
-        select(User).where(User.supabase_id == current_user.id)
-    )
-    db_user = user_result.scalars().first()
-    
-    if not db_user:
-        logger.warning(f"User not found in database for Supabase ID: {current_user.id}")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found in database",
-        )
+    logger.info("Processing voice command for user: %s", db_user.id)
     
     try:
         # Upload audio file to storage
@@ -263,7 +219,7 @@ async def process_voice_command(
         command_text = await openai_service.transcribe_audio(audio_url)
         response = await openai_service.process_voice_command(command_text, db_user.id)
         
-        logger.info(f"Voice command processed successfully: {command_text}")
+        logger.info("Voice command processed successfully: %s", command_text)
         
         return {
             "command": command_text,
@@ -271,8 +227,12 @@ async def process_voice_command(
             "success": True,
         }
         
+    except HTTPException:
+        # Let deliberate HTTP errors (e.g. the 413 for oversized uploads)
+        # through instead of masking them as 500s
+        raise
     except Exception as e:
-        logger.error(f"Error processing voice command: {str(e)}")
+        logger.error("Error processing voice command: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error processing voice command: {str(e)}",
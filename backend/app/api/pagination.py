@@ -0,0 +1,98 @@
+"""
+Keyset pagination helpers for list endpoints.
+
+This module encodes and decodes opaque cursors for (created_at, id) keyset
+pagination, which keeps page cost constant instead of the O(skip) row walk
+that OFFSET pagination forces on the database.
+"""
+import base64
+import binascii
+import uuid
+from datetime import datetime
+from typing import Any, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import literal, tuple_
+
+
+def encode_cursor(created_at: datetime, row_id: uuid.UUID) -> str:
+    """
+    Encode a (created_at, id) position as an opaque cursor string.
+
+    Args:
+        created_at: Creation timestamp of the last row on the page
+        row_id: Primary key of the last row on the page
+
+    Returns:
+        str: URL-safe cursor token
+    """
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """
+    Decode a cursor back into its (created_at, id) position.
+
+    Args:
+        cursor: Cursor token from a previous page
+
+    Returns:
+        Tuple[datetime, uuid.UUID]: Position of the last row already seen
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode()
+        ts_part, id_part = raw.split("|", 1)
+        return datetime.fromisoformat(ts_part), uuid.UUID(id_part)
+    except (ValueError, binascii.Error, UnicodeDecodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        )
+
+
+def keyset_filter(
+    ts_col: Any, id_col: Any, cursor_ts: datetime, cursor_id: uuid.UUID
+) -> Any:
+    """
+    Build the keyset predicate for rows before the cursor position.
+
+    The cursor values are bound through the column types explicitly: inside
+    `tuple_()` SQLAlchemy would otherwise infer generic types, and on sqlite
+    the generic DATETIME renders microseconds while the stored
+    CURRENT_TIMESTAMP defaults do not, making equal timestamps compare
+    unequal as strings and re-serving already-seen pages.
+
+    Args:
+        ts_col: Timestamp column of the keyset index
+        id_col: Id column used as the tiebreaker
+        cursor_ts: Timestamp of the last row already seen
+        cursor_id: Id of the last row already seen
+
+    Returns:
+        Any: SQL boolean expression for the WHERE clause
+    """
+    return tuple_(ts_col, id_col) < tuple_(
+        literal(cursor_ts, ts_col.type), literal(cursor_id, id_col.type)
+    )
+
+
+def next_cursor(rows: list, limit: int) -> Optional[str]:
+    """
+    Build the cursor for the following page, if one may exist.
+
+    Args:
+        rows: Rows returned for the current page
+        limit: Page size that was requested
+
+    Returns:
+        Optional[str]: Cursor for the next page, or None on the last page
+    """
+    if not rows or len(rows) < limit:
+        return None
+    last = rows[-1]
+    return encode_cursor(last.created_at, last.id)
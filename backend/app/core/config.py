@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Union
 
 from pydantic import AnyHttpUrl, PostgresDsn, field_validator
@@ -11,11 +12,20 @@ class Settings(BaseSettings):
     """
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", case_sensitive=True)
     
+    # Project metadata
+    PROJECT_NAME: str = "Rivo API"
+    PROJECT_DESCRIPTION: str = "Backend API for Rivo Real Estate Application"
+    PROJECT_VERSION: str = "0.1.0"
+
     # API Configuration
     API_HOST: str
     API_PORT: int
+    API_PREFIX: str = ""
     DEBUG: bool
     ENVIRONMENT: str
+    # Ship OpenAPI example payloads with the schemas; disable in production
+    # to keep the example dicts out of every worker's resident memory
+    ENABLE_OPENAPI_EXAMPLES: bool = True
     
     # Security
     SECRET_KEY: str
@@ -36,11 +46,22 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: PostgresDsn
-    
+    # "session" pools connections in-process; set to "transaction" when
+    # connecting through pgbouncer/Supavisor in transaction mode, where the
+    # pooler owns the connections and prepared statements must be disabled
+    DB_POOL_MODE: str = "session"
+
     # Supabase
     SUPABASE_URL: str
     SUPABASE_KEY: str
     SUPABASE_JWT_SECRET: str
+
+    # Google OAuth
+    GOOGLE_CLIENT_ID: str = ""
+    GOOGLE_CLIENT_SECRET: str = ""
+
+    # Frontend
+    FRONTEND_URL: str = "http://localhost:3000"
     
     # OpenAI
     OPENAI_API_KEY: str
@@ -50,10 +71,23 @@ class Settings(BaseSettings):
     AWS_SECRET_ACCESS_KEY: str
     AWS_REGION: str
     AWS_BUCKET_NAME: str
-    
+    # Uploads larger than this are rejected with 413 before any bytes are
+    # read, so a runaway upload cannot grow a worker's resident memory
+    MAX_UPLOAD_BYTES: int = 25 * 1024 * 1024
+
     # Logging
     LOG_LEVEL: str = "INFO"
 
 
-# Create global settings instance
-settings = Settings()
+@lru_cache
+def get_settings() -> Settings:
+    """Return the process-wide settings instance.
+
+    Env parsing and validation run exactly once; every caller gets the same
+    object, so nothing on a hot path ever re-reads the environment.
+    """
+    return Settings()
+
+
+# Global settings instance, shared by all module-level `settings` imports
+settings = get_settings()
@@ -3,25 +3,77 @@ Security utilities for JWT token generation and validation.
 
 This module provides functions for JWT token generation, validation, and password hashing.
 """
-from datetime import datetime, timedelta
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import time
 from typing import Any, Dict, Optional
 
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import bcrypt
+import jwt
+from argon2 import PasswordHasher
+from argon2.exceptions import Argon2Error, InvalidHashError
+from cachetools import TTLCache
+from jwt import InvalidTokenError
 
 from app.core.config import settings
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing: Argon2id for new hashes (better security per millisecond
+# than bcrypt cost 12 on modern CPUs); bcrypt is kept only to verify hashes
+# created before the migration, which are rehashed lazily on login.
+_PH = PasswordHasher(time_cost=2, memory_cost=64 * 1024, parallelism=1)
 
 # JWT token settings
 ALGORITHM = "HS256"
-ACCESS_TOKEN_EXPIRE_MINUTES = 30
+# Access tokens are short-lived so request handling can trust the signed
+# claims without a per-request DB check; revocation lag is bounded by this
+# TTL, after which clients must go through /refresh (which does hit the DB).
+ACCESS_TOKEN_EXPIRE_MINUTES = 5
 REFRESH_TOKEN_EXPIRE_DAYS = 7
 
+# Token lifetimes in seconds, precomputed so issuing a token is a single
+# time.time() call plus integer addition
+_ACCESS_TTL = ACCESS_TOKEN_EXPIRE_MINUTES * 60
+_REFRESH_TTL = REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
+
+# Pre-bound signer state: the header never changes and the HMAC key is
+# derived from a frozen setting, so both are computed once at import.
+_JWT_HEADER_B64 = base64.urlsafe_b64encode(
+    json.dumps({"alg": ALGORITHM, "typ": "JWT"}, separators=(",", ":")).encode()
+).rstrip(b"=")
+_HMAC_KEY = settings.SECRET_KEY.encode()
+# Reused on every decode so PyJWT does not rebuild the list per call
+_ALGORITHMS = [ALGORITHM]
+
+
+def _b64url(data: bytes) -> bytes:
+    """Base64url-encode without padding, as required by JWT."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _encode_token(claims: Dict[str, Any]) -> str:
+    """
+    Encode and sign a JWT with the pre-bound HS256 signer.
+
+    Skips re-encoding the constant header and re-deriving the key on every
+    call; the output is a standard HS256 JWT verifiable by PyJWT.
+
+    Args:
+        claims: Claims to encode in the token
+
+    Returns:
+        str: Signed JWT
+    """
+    payload_b64 = _b64url(json.dumps(claims, separators=(",", ":")).encode())
+    signing_input = _JWT_HEADER_B64 + b"." + payload_b64
+    signature = hmac.new(_HMAC_KEY, signing_input, hashlib.sha256).digest()
+    return (signing_input + b"." + _b64url(signature)).decode("ascii")
+
 
 def create_access_token(data: Dict[str, Any]) -> str:
     """
@@ -34,10 +86,9 @@ def create_access_token(data: Dict[str, Any]) -> str:
         str: JWT token
     """
     to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire})
-    
-    return jwt.encode(to_encode, settings.jwt_secret_key, algorithm=ALGORITHM)
+    to_encode["exp"] = int(time.time()) + _ACCESS_TTL
+
+    return _encode_token(to_encode)
 
 
 def create_refresh_token(data: Dict[str, Any]) -> str:
@@ -51,10 +102,15 @@ def create_refresh_token(data: Dict[str, Any]) -> str:
         str: JWT refresh token
     """
     to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
-    to_encode.update({"exp": expire, "token_type": "refresh"})
-    
-    return jwt.encode(to_encode, settings.jwt_secret_key, algorithm=ALGORITHM)
+    to_encode.update({"exp": int(time.time()) + _REFRESH_TTL, "token_type": "refresh"})
+
+    return _encode_token(to_encode)
+
+
+# Short-lived cache of verified token payloads, keyed by a blake2b digest of
+# the token so raw tokens are never stored. A valid token re-presented within
+# the TTL skips the HMAC verification entirely.
+_payload_cache: TTLCache = TTLCache(maxsize=50_000, ttl=60)
 
 
 def verify_token(token: str) -> Optional[Dict[str, Any]]:
@@ -67,13 +123,56 @@ def verify_token(token: str) -> Optional[Dict[str, Any]]:
     Returns:
         Optional[Dict[str, Any]]: Token payload if valid, None otherwise
     """
+    cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    payload = _payload_cache.get(cache_key)
+    if payload is not None:
+        # Never serve a cached payload past its own expiry
+        if payload.get("exp", 0) > time.time():
+            return payload
+        del _payload_cache[cache_key]
+        return None
+
     try:
-        payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[ALGORITHM])
-        return payload
-    except JWTError as e:
+        payload = jwt.decode(token, _HMAC_KEY, algorithms=_ALGORITHMS)
+    except InvalidTokenError as e:
         logger.error(f"Token validation error: {str(e)}")
         return None
 
+    _payload_cache[cache_key] = payload
+    return payload
+
+
+def hash_token(token: str) -> str:
+    """
+    Hash a high-entropy token for storage.
+
+    API keys and refresh tokens are already cryptographically random, so a
+    single SHA-256 pass is sufficient; bcrypt's cost factor only matters for
+    low-entropy secrets like user passwords.
+
+    Args:
+        token: High-entropy token to hash
+
+    Returns:
+        str: Hex-encoded SHA-256 digest
+    """
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def verify_token_hash(token: str, token_hash: str) -> bool:
+    """
+    Verify a high-entropy token against its stored hash.
+
+    Args:
+        token: High-entropy token to check
+        token_hash: Stored hash produced by hash_token
+
+    Returns:
+        bool: True if the token matches the hash, False otherwise
+    """
+    return hmac.compare_digest(hash_token(token), token_hash)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
@@ -86,7 +185,37 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         bool: True if password matches hash, False otherwise
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    if hashed_password.startswith("$2"):
+        # Legacy bcrypt hash from before the Argon2id migration
+        try:
+            return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+        except ValueError:
+            return False
+    try:
+        return _PH.verify(hashed_password, plain_password)
+    except (Argon2Error, InvalidHashError):
+        return False
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Check whether a stored hash predates the current Argon2id parameters.
+
+    Login calls this after a successful verification so legacy bcrypt hashes
+    (and Argon2 hashes with outdated parameters) are upgraded in place.
+
+    Args:
+        hashed_password: Stored password hash
+
+    Returns:
+        bool: True if the hash should be regenerated
+    """
+    if hashed_password.startswith("$2"):
+        return True
+    try:
+        return _PH.check_needs_rehash(hashed_password)
+    except InvalidHashError:
+        return True
 
 
 def get_password_hash(password: str) -> str:
@@ -99,4 +228,38 @@ def get_password_hash(password: str) -> str:
     Returns:
         str: Hashed password
     """
-    return pwd_context.hash(password)
+    return _PH.hash(password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password against its hash in a worker thread.
+
+    Password hashing takes milliseconds of pure CPU by design; running it in
+    the default executor keeps the event loop free for other requests.
+
+    Args:
+        plain_password: Plain text password
+        hashed_password: Hashed password
+
+    Returns:
+        bool: True if password matches hash, False otherwise
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        None, verify_password, plain_password, hashed_password
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    """
+    Hash a password in a worker thread.
+
+    Args:
+        password: Plain text password
+
+    Returns:
+        str: Hashed password
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, get_password_hash, password)
@@ -1,8 +1,19 @@
 from typing import Any
 
+from sqlalchemy import DateTime
+from sqlalchemy.dialects.sqlite import DATETIME as _SQLITE_DATETIME
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.orm import DeclarativeBase
 
+# Shared timestamp type for created_at/updated_at columns. On sqlite (the
+# test backend) CURRENT_TIMESTAMP stores second-granularity strings, so bound
+# datetimes must not carry a fractional part or the string comparisons behind
+# (created_at, id) keyset pagination misorder equal-second rows and re-serve
+# pages. Other dialects keep the plain timezone-aware DATETIME.
+TimestampType = DateTime(timezone=True).with_variant(
+    _SQLITE_DATETIME(truncate_microseconds=True), "sqlite"
+)
+
 
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
@@ -12,6 +23,22 @@ class Base(DeclarativeBase):
         """Generate __tablename__ automatically from class name."""
         return cls.__name__.lower()
     
+    @classmethod
+    def _column_names(cls) -> tuple[str, ...]:
+        """Column names for this model, computed once per class."""
+        # Checked via cls.__dict__ so subclasses don't inherit a parent's cache
+        names = cls.__dict__.get("_cached_column_names")
+        if names is None:
+            names = tuple(c.name for c in cls.__table__.columns)
+            cls._cached_column_names = names
+        return names
+
     def dict(self) -> dict[str, Any]:
         """Convert model instance to dictionary."""
-        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
+        # Loaded attributes live in __dict__; fall back to getattr only for
+        # expired/deferred columns so the common case skips the ORM descriptor
+        state = self.__dict__
+        return {
+            name: state[name] if name in state else getattr(self, name)
+            for name in self._column_names()
+        }
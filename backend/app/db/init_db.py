@@ -7,24 +7,58 @@ and seed data if needed.
 import asyncio
 from typing import Any
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.logging import get_logger
-from app.db.session import AsyncSessionLocal
+from app.db.session import AsyncSessionLocal, engine
 
 # Import all models to ensure they are registered with SQLAlchemy
 from app.models import *  # noqa
 
 logger = get_logger(__name__)
 
+# Advisory-lock key for init leader election; any constant shared by all
+# workers works, it just has to be unique within this database
+_INIT_LOCK_KEY = 0x5269766F  # "Rivo"
+
 
 async def init_db() -> None:
-    """Initialize database with required tables and seed data."""
+    """Initialize database with required tables and seed data.
+
+    Every uvicorn worker runs the lifespan hook, so on Postgres a session
+    advisory lock elects one worker to do the (idempotent) setup; the rest
+    skip it instead of repeating the same roundtrips at every boot.
+    """
     logger.info("Initializing database")
-    
-    async with AsyncSessionLocal() as session:
-        await create_initial_data(session)
-    
+
+    if engine.dialect.name == "postgresql":
+        # The advisory lock is connection-scoped, so the whole
+        # acquire -> work -> release sequence runs on one pinned
+        # connection; going through the session pool could hand the
+        # unlock a different connection and leave the lock held.
+        async with engine.connect() as conn:
+            acquired = await conn.scalar(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": _INIT_LOCK_KEY}
+            )
+            if not acquired:
+                logger.info("Another worker is initializing the database; skipping")
+                return
+            try:
+                # Needed by the trigram GIN indexes on properties
+                await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+                await conn.commit()
+                async with AsyncSession(bind=conn) as session:
+                    await create_initial_data(session)
+                    await session.commit()
+            finally:
+                await conn.execute(
+                    text("SELECT pg_advisory_unlock(:key)"), {"key": _INIT_LOCK_KEY}
+                )
+    else:
+        async with AsyncSessionLocal() as session:
+            await create_initial_data(session)
+
     logger.info("Database initialization completed")
 
 
@@ -1,20 +1,45 @@
 from typing import AsyncGenerator
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 
 from app.core.config import settings
-from app.core.logging import get_logger
 
-logger = get_logger(__name__)
-
-# Create async engine
-engine = create_async_engine(
-    str(settings.DATABASE_URL),
+_engine_kwargs = dict(
     echo=settings.DEBUG,
     future=True,
-    pool_pre_ping=True,
+    # Generous compiled-statement cache so hot auth SELECTs skip re-compilation
+    query_cache_size=1200,
 )
 
+if settings.DB_POOL_MODE == "transaction":
+    # Behind pgbouncer/Supavisor in transaction mode the external pooler owns
+    # the connections, so in-process pooling adds nothing and server-side
+    # prepared statements break when statements outlive their connection.
+    _engine_kwargs.update(
+        poolclass=NullPool,
+        connect_args={
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+        },
+    )
+else:
+    # Explicitly sized in-process pool so every request reuses warm
+    # connections instead of paying the TCP+TLS+startup cost to Postgres.
+    _engine_kwargs.update(
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=20,
+        max_overflow=40,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        # Fail fast instead of queueing indefinitely when the pool is exhausted
+        pool_timeout=5,
+        # Let asyncpg keep prepared statements for the whole hot query set
+        connect_args={"statement_cache_size": 1024},
+    )
+
+engine = create_async_engine(str(settings.DATABASE_URL), **_engine_kwargs)
+
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -27,14 +52,14 @@ AsyncSessionLocal = async_sessionmaker(
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency for getting async database sessions.
-    
+
+    The request runs inside a single transaction that is committed once when
+    the handler returns and rolled back if it raises, so handlers never call
+    `commit()` themselves (one WAL flush per request instead of several).
+
     Yields:
         AsyncSession: SQLAlchemy async session
     """
-    session = AsyncSessionLocal()
-    try:
-        logger.debug("Creating new database session")
-        yield session
-    finally:
-        logger.debug("Closing database session")
-        await session.close()
+    async with AsyncSessionLocal() as session:
+        async with session.begin():
+            yield session
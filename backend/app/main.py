@@ -3,18 +3,50 @@ Main application module.
 
 This module initializes and configures the FastAPI application.
 """
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.openapi.docs import get_swagger_ui_html
 from fastapi.openapi.utils import get_openapi
+from sqlalchemy import text
 
+from app.api.deps import get_openai_service
 from app.api.router import api_router
 from app.core.config import settings
-from app.core.logging import configure_logging
+from app.core.logging import setup_logging
 from app.db.init_db import init_db
+from app.db.session import engine
+from app.services import google_auth, supabase
+
+# Computed once at import: CORSMiddleware does a membership check against
+# this collection on every cross-origin request, so hand it an immutable
+# tuple rather than rebuilding a list in create_application
+_CORS_ORIGINS = tuple(str(origin) for origin in settings.BACKEND_CORS_ORIGINS)
+
+
+async def _warm_db_pool() -> None:
+    """
+    Fill the connection pool before serving traffic.
+
+    The async engine has no min_size, so without this the first burst of
+    requests after a deploy each pays the full connection setup cost. Opening
+    pool_size connections concurrently establishes them all up front; they
+    return to the pool as each task exits.
+    """
+    # NullPool (transaction-mode pooler) has nothing to warm
+    pool_size = getattr(engine.pool, "size", lambda: 0)()
+    if not pool_size:
+        return
+
+    async def ping() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(ping() for _ in range(pool_size)))
 
 
 @asynccontextmanager
@@ -28,17 +60,25 @@ async def lifespan(app: FastAPI):
         app: FastAPI application
     """
     # Startup
-    configure_logging()
+    setup_logging()
     logging.info("Starting Rivo API server")
     
-    # Initialize database
+    # Initialize database and warm the connection pool
     await init_db()
-    
+    await _warm_db_pool()
+
     yield
-    
+
     # Shutdown
     logging.info("Shutting down Rivo API server")
 
+    # Close the shared service clients if they were created
+    if get_openai_service.cache_info().currsize:
+        await get_openai_service().aclose()
+        get_openai_service.cache_clear()
+    await google_auth.aclose_client()
+    await supabase.aclose_client()
+
 
 def create_application() -> FastAPI:
     """
@@ -48,27 +88,30 @@ def create_application() -> FastAPI:
         FastAPI: Configured FastAPI application
     """
     app = FastAPI(
-        title=settings.project_name,
-        description=settings.project_description,
-        version=settings.project_version,
+        title=settings.PROJECT_NAME,
+        description=settings.PROJECT_DESCRIPTION,
+        version=settings.PROJECT_VERSION,
         docs_url=None,
         redoc_url=None,
-        openapi_url=f"{settings.api_prefix}/openapi.json" if settings.environment != "production" else None,
+        openapi_url=f"{settings.API_PREFIX}/openapi.json" if settings.ENVIRONMENT != "production" else None,
         lifespan=lifespan,
+        # orjson handles the UUID/datetime-heavy payloads our models emit
+        # natively and several times faster than stdlib json
+        default_response_class=ORJSONResponse,
     )
-    
+
     # Set up CORS
-    if settings.backend_cors_origins:
+    if _CORS_ORIGINS:
         app.add_middleware(
             CORSMiddleware,
-            allow_origins=[str(origin) for origin in settings.backend_cors_origins],
+            allow_origins=_CORS_ORIGINS,
             allow_credentials=True,
             allow_methods=["*"],
             allow_headers=["*"],
         )
     
     # Include API router
-    app.include_router(api_router, prefix=settings.api_prefix)
+    app.include_router(api_router, prefix=settings.API_PREFIX)
     
     # Custom documentation endpoints
     @app.get("/docs", include_in_schema=False)
@@ -80,8 +123,8 @@ def create_application() -> FastAPI:
             HTML: Swagger UI HTML
         """
         return get_swagger_ui_html(
-            openapi_url=f"{settings.api_prefix}/openapi.json",
-            title=f"{settings.project_name} - API Documentation",
+            openapi_url=f"{settings.API_PREFIX}/openapi.json",
+            title=f"{settings.PROJECT_NAME} - API Documentation",
             swagger_favicon_url="",
         )
     
@@ -94,9 +137,9 @@ def create_application() -> FastAPI:
             dict: OpenAPI schema
         """
         return get_openapi(
-            title=settings.project_name,
-            version=settings.project_version,
-            description=settings.project_description,
+            title=settings.PROJECT_NAME,
+            version=settings.PROJECT_VERSION,
+            description=settings.PROJECT_DESCRIPTION,
             routes=app.routes,
         )
     
@@ -107,11 +150,20 @@ app = create_application()
 
 
 if __name__ == "__main__":
+    import os
+
     import uvicorn
-    
+
+    dev_mode = settings.ENVIRONMENT != "production"
+
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=settings.environment != "production",
+        # libuv event loop and C HTTP parser; both are pure drop-ins
+        loop="uvloop",
+        http="httptools",
+        reload=dev_mode,
+        # reload and multiple workers are mutually exclusive in uvicorn
+        workers=1 if dev_mode else 2 * (os.cpu_count() or 1) + 1,
     )
@@ -7,11 +7,10 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, String, Text, func
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Boolean, Column, ForeignKey, String, Text, Uuid, func
 from sqlalchemy.orm import relationship
 
-from app.db.base import Base
+from app.db.base import Base, TimestampType
 
 
 class EmailTemplate(Base):
@@ -31,17 +30,17 @@ class EmailTemplate(Base):
     
     __tablename__ = "email_templates"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
     user_id = Column(
-        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        Uuid, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     name = Column(String(100), nullable=False)
     subject = Column(String(255), nullable=False)
     body = Column(Text, nullable=False)
     is_default = Column(Boolean, default=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(TimestampType, server_default=func.now())
     updated_at = Column(
-        DateTime(timezone=True), 
+        TimestampType, 
         server_default=func.now(), 
         onupdate=func.now()
     )
@@ -8,20 +8,23 @@ from datetime import datetime
 from typing import List, Optional
 
 from sqlalchemy import (
+    JSON,
     Boolean,
     Column,
-    DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    Uuid,
     func,
+    text,
 )
-from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Mapped, relationship
 
-from app.db.base import Base
+from app.db.base import Base, TimestampType
 
 
 class Property(Base):
@@ -54,10 +57,57 @@ class Property(Base):
     """
     
     __tablename__ = "properties"
-    
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+
+    # Trigram GIN indexes so the ILIKE '%term%' filters in the list endpoint
+    # use index lookups instead of sequential scans. The postgresql_* kwargs
+    # are ignored on other dialects; the pg_trgm extension is created in
+    # init_db at startup.
+    __table_args__ = (
+        Index(
+            "ix_properties_city_trgm",
+            "city",
+            postgresql_using="gin",
+            postgresql_ops={"city": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_properties_state_trgm",
+            "state",
+            postgresql_using="gin",
+            postgresql_ops={"state": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_properties_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_properties_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ),
+        # Partial composites matching the common list-endpoint filter shapes;
+        # every list query already constrains is_published = true
+        Index(
+            "ix_properties_pub_category_price",
+            "category",
+            "price",
+            postgresql_where=text("is_published = true"),
+        ),
+        Index(
+            "ix_properties_pub_city_price",
+            "city",
+            "price",
+            postgresql_where=text("is_published = true"),
+        ),
+        # Backs the (created_at, id) keyset pagination in the list endpoint
+        Index("ix_properties_created_id", "created_at", "id"),
+    )
+
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
     user_id = Column(
-        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        Uuid, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
@@ -74,11 +124,11 @@ class Property(Base):
     bathrooms = Column(Float, nullable=True)
     square_feet = Column(Float, nullable=True)
     year_built = Column(Integer, nullable=True)
-    features = Column(ARRAY(String), nullable=True)
+    features = Column(ARRAY(String).with_variant(JSON(), "sqlite"), nullable=True)
     is_published = Column(Boolean, default=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(TimestampType, server_default=func.now())
     updated_at = Column(
-        DateTime(timezone=True), 
+        TimestampType, 
         server_default=func.now(), 
         onupdate=func.now()
     )
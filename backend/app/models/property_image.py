@@ -7,11 +7,19 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, String, Text, func
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import (
+    Boolean,
+    Column,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+    Uuid,
+    func,
+)
 from sqlalchemy.orm import Mapped, relationship
 
-from app.db.base import Base
+from app.db.base import Base, TimestampType
 
 
 class PropertyImage(Base):
@@ -33,10 +41,22 @@ class PropertyImage(Base):
     """
     
     __tablename__ = "property_images"
-    
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+
+    # Serves the per-property image lookups (correlated count/primary-url
+    # subqueries, the image list with its is_primary/created_at ordering, and
+    # the bulk primary-demotion UPDATE); the FK alone had no index
+    __table_args__ = (
+        Index(
+            "ix_property_images_property_primary",
+            "property_id",
+            "is_primary",
+            "created_at",
+        ),
+    )
+
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
     property_id = Column(
-        UUID(as_uuid=True), ForeignKey("properties.id", ondelete="CASCADE"), nullable=False
+        Uuid, ForeignKey("properties.id", ondelete="CASCADE"), nullable=False
     )
     storage_path = Column(String, nullable=False)
     url = Column(String, nullable=False)
@@ -45,9 +65,9 @@ class PropertyImage(Base):
     voice_note_text = Column(Text, nullable=True)
     voice_note_path = Column(String, nullable=True)
     is_primary = Column(Boolean, default=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(TimestampType, server_default=func.now())
     updated_at = Column(
-        DateTime(timezone=True), 
+        TimestampType, 
         server_default=func.now(), 
         onupdate=func.now()
     )
@@ -7,10 +7,9 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, Column, DateTime, String, func
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Boolean, Column, Index, String, Uuid, func
 
-from app.db.base import Base
+from app.db.base import Base, TimestampType
 
 
 class User(Base):
@@ -31,9 +30,21 @@ class User(Base):
     """
     
     __tablename__ = "users"
+    __table_args__ = (
+        # Covering index so the login lookup by email can be served
+        # index-only on Postgres (INCLUDE is ignored on other backends)
+        Index(
+            "ix_users_email_covering",
+            "email",
+            unique=True,
+            postgresql_include=["id", "is_active", "hashed_password"],
+        ),
+        # Backs the (created_at, id) keyset pagination in the users list
+        Index("ix_users_created_id", "created_at", "id"),
+    )
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    email = Column(String, unique=True, nullable=False, index=True)
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    email = Column(String, nullable=False)
     hashed_password = Column(String, nullable=True)
     full_name = Column(String, nullable=True)
     auth_provider = Column(String, nullable=False, default="email")
@@ -41,9 +52,9 @@ class User(Base):
     apple_id = Column(String, unique=True, nullable=True, index=True)
     supabase_id = Column(String, unique=True, nullable=True, index=True)  # Kept for backward compatibility
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(TimestampType, server_default=func.now())
     updated_at = Column(
-        DateTime(timezone=True), 
+        TimestampType, 
         server_default=func.now(), 
         onupdate=func.now()
     )
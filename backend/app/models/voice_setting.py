@@ -7,11 +7,10 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, String, Text, func
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Boolean, Column, Float, ForeignKey, String, Text, Uuid, func
 from sqlalchemy.orm import relationship
 
-from app.db.base import Base
+from app.db.base import Base, TimestampType
 
 
 class VoiceSetting(Base):
@@ -32,18 +31,19 @@ class VoiceSetting(Base):
     
     __tablename__ = "voice_settings"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    # One settings row per user; the unique index makes get-or-create atomic
     user_id = Column(
-        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        Uuid, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, unique=True
     )
     wake_word = Column(String(50), default="Rivo Start")
     voice_type = Column(String(20), default="female")
     voice_language = Column(String(20), default="en-US")
     is_enabled = Column(Boolean, default=True)
     volume = Column(Float, default=0.7)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(TimestampType, server_default=func.now())
     updated_at = Column(
-        DateTime(timezone=True), 
+        TimestampType, 
         server_default=func.now(), 
         onupdate=func.now()
     )
@@ -1,54 +1,74 @@
 """
 Schemas package initialization.
 
-This module imports all schema classes to make them available
-when importing from the schemas package.
+This module exposes all schema classes lazily (PEP 562): importing one
+schema module no longer drags in every other module's Pydantic models and
+their compiled core-schemas, which keeps cold-start time and resident
+memory proportional to what a router actually uses.
 """
+import importlib
+from typing import TYPE_CHECKING
 
-from app.schemas.email_template import (
-    EmailTemplateCreate,
-    EmailTemplateInDB,
-    EmailTemplateResponse,
-    EmailTemplateUpdate,
-)
-from app.schemas.property import (
-    PropertyCreate,
-    PropertyInDB,
-    PropertyResponse,
-    PropertyUpdate,
-)
-from app.schemas.property_image import (
-    PropertyImageCreate,
-    PropertyImageInDB,
-    PropertyImageResponse,
-    PropertyImageUpdate,
-)
-from app.schemas.user import UserCreate, UserResponse, UserUpdate
-from app.schemas.voice_setting import (
-    VoiceSettingCreate,
-    VoiceSettingInDB,
-    VoiceSettingResponse,
-    VoiceSettingUpdate,
-)
+if TYPE_CHECKING:
+    from app.schemas.email_template import (
+        EmailTemplateCreate,
+        EmailTemplateInDB,
+        EmailTemplateResponse,
+        EmailTemplateUpdate,
+    )
+    from app.schemas.property import (
+        PropertyCreate,
+        PropertyInDB,
+        PropertyResponse,
+        PropertyUpdate,
+    )
+    from app.schemas.property_image import (
+        PropertyImageCreate,
+        PropertyImageInDB,
+        PropertyImageResponse,
+        PropertyImageUpdate,
+    )
+    from app.schemas.user import UserCreate, UserResponse, UserUpdate
+    from app.schemas.voice_setting import (
+        VoiceSettingCreate,
+        VoiceSettingInDB,
+        VoiceSettingResponse,
+        VoiceSettingUpdate,
+    )
 
-__all__ = [
-    "EmailTemplateCreate",
-    "EmailTemplateInDB",
-    "EmailTemplateResponse",
-    "EmailTemplateUpdate",
-    "PropertyCreate",
-    "PropertyInDB",
-    "PropertyResponse",
-    "PropertyUpdate",
-    "PropertyImageCreate",
-    "PropertyImageInDB",
-    "PropertyImageResponse",
-    "PropertyImageUpdate",
-    "UserCreate",
-    "UserResponse",
-    "UserUpdate",
-    "VoiceSettingCreate",
-    "VoiceSettingInDB",
-    "VoiceSettingResponse",
-    "VoiceSettingUpdate",
-]
+# Maps exported names to the submodule that defines them
+_SCHEMA_MAP = {
+    "EmailTemplateCreate": "email_template",
+    "EmailTemplateInDB": "email_template",
+    "EmailTemplateResponse": "email_template",
+    "EmailTemplateUpdate": "email_template",
+    "PropertyCreate": "property",
+    "PropertyInDB": "property",
+    "PropertyResponse": "property",
+    "PropertyUpdate": "property",
+    "PropertyImageCreate": "property_image",
+    "PropertyImageInDB": "property_image",
+    "PropertyImageResponse": "property_image",
+    "PropertyImageUpdate": "property_image",
+    "UserCreate": "user",
+    "UserResponse": "user",
+    "UserUpdate": "user",
+    "VoiceSettingCreate": "voice_setting",
+    "VoiceSettingInDB": "voice_setting",
+    "VoiceSettingResponse": "voice_setting",
+    "VoiceSettingUpdate": "voice_setting",
+}
+
+def __getattr__(name: str):
+    """Resolve schema exports lazily on first attribute access."""
+    try:
+        module_name = _SCHEMA_MAP[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module("." + module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+__all__ = list(_SCHEMA_MAP)
@@ -0,0 +1,33 @@
+"""
+Shared schema helpers.
+
+This module defines mixins shared by the response schemas.
+"""
+from typing import Any
+
+from pydantic import ConfigDict
+
+# Shared base configuration for response schemas; modules extend it with
+# their own json_schema_extra instead of each declaring an inner Config
+# class, which pydantic v2 converts to a fresh ConfigDict per class anyway.
+RESPONSE_CONFIG = ConfigDict(from_attributes=True)
+
+
+class TrustedFromORM:
+    """
+    Mixin adding validation-free construction from ORM rows.
+
+    Response schemas describe rows that just came out of the database, where
+    the schema invariants are already enforced; re-running full recursive
+    validation on them is pure overhead. `from_orm_trusted` builds the model
+    with `model_construct`, skipping validation entirely. It must only be
+    used for trusted internal data — user-submitted payloads keep going
+    through `model_validate`.
+    """
+
+    @classmethod
+    def from_orm_trusted(cls, obj: Any):
+        """Build the schema from a trusted ORM row without validation."""
+        return cls.model_construct(
+            **{name: getattr(obj, name, None) for name in cls.model_fields}
+        )
@@ -3,11 +3,39 @@ EmailTemplate schemas for request and response validation.
 
 This module defines Pydantic models for EmailTemplate data validation and serialization.
 """
+import re
+import string
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+from app.core.config import settings
+from app.schemas.base import RESPONSE_CONFIG, TrustedFromORM
+
+# Matches {{ placeholder }} markers in template bodies; compiled once
+_PLACEHOLDER_RE = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+
+# OpenAPI example payload, retained only while examples are enabled
+_RESPONSE_EXAMPLE = {
+    "id": "123e4567-e89b-12d3-a456-426614174000",
+    "user_id": "123e4567-e89b-12d3-a456-426614174001",
+    "name": "Property Inquiry",
+    "subject": "Information about {{property_address}}",
+    "body": "Hello {{recipient_name}},\n\nThank you for your interest in the property at {{property_address}}. Here are the details you requested:\n\n{{property_details}}\n\nPlease let me know if you have any questions.\n\nBest regards,\n{{sender_name}}",
+    "is_default": True,
+    "created_at": "2023-01-01T00:00:00Z",
+    "updated_at": "2023-01-01T00:00:00Z",
+}
+
+_RESPONSE_CONFIG = ConfigDict(
+    **RESPONSE_CONFIG,
+    json_schema_extra=(
+        {"example": _RESPONSE_EXAMPLE} if settings.ENABLE_OPENAPI_EXAMPLES else {}
+    ),
+)
 
 
 class EmailTemplateBase(BaseModel):
@@ -36,29 +64,34 @@ class EmailTemplateUpdate(BaseModel):
 
 class EmailTemplateInDB(EmailTemplateBase):
     """Schema for EmailTemplate data as stored in the database."""
-    
+
     id: UUID
     user_id: UUID
     created_at: datetime
     updated_at: datetime
 
+    # Parsed once at construction so rendering never re-walks the body
+    _placeholders: frozenset = PrivateAttr(default=frozenset())
+    _compiled_template: Optional[string.Template] = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Precompile the template body once at construction time."""
+        self._placeholders = frozenset(_PLACEHOLDER_RE.findall(self.body))
+        self._compiled_template = string.Template(
+            _PLACEHOLDER_RE.sub(r"${\1}", self.body)
+        )
+
+    @property
+    def placeholders(self) -> frozenset:
+        """Placeholder names referenced by the template body."""
+        return self._placeholders
+
+    def render(self, context: Dict[str, Any]) -> str:
+        """Render the body by dict substitution against the compiled form."""
+        return self._compiled_template.safe_substitute(context)
+
 
-class EmailTemplateResponse(EmailTemplateInDB):
+class EmailTemplateResponse(TrustedFromORM, EmailTemplateInDB):
     """Schema for EmailTemplate response data."""
     
-    class Config:
-        """Pydantic configuration."""
-        
-        from_attributes = True
-        json_schema_extra = {
-            "example": {
-                "id": "123e4567-e89b-12d3-a456-426614174000",
-                "user_id": "123e4567-e89b-12d3-a456-426614174001",
-                "name": "Property Inquiry",
-                "subject": "Information about {{property_address}}",
-                "body": "Hello {{recipient_name}},\n\nThank you for your interest in the property at {{property_address}}. Here are the details you requested:\n\n{{property_details}}\n\nPlease let me know if you have any questions.\n\nBest regards,\n{{sender_name}}",
-                "is_default": True,
-                "created_at": "2023-01-01T00:00:00Z",
-                "updated_at": "2023-01-01T00:00:00Z",
-            }
-        }
+    model_config = _RESPONSE_CONFIG
@@ -7,7 +7,82 @@ from datetime import datetime
 from typing import List, Optional, Union
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from app.core.config import settings
+from app.schemas.base import RESPONSE_CONFIG, TrustedFromORM
+
+# Hoisted to module level so validation does one hashed membership check per
+# call instead of rebuilding the list and error string
+_ALLOWED_CATEGORIES = frozenset(
+    {
+        "residential", "commercial", "land", "industrial",
+        "apartment", "house", "condo", "townhouse", "other",
+    }
+)
+_ALLOWED_CATEGORIES_MSG = "Category must be one of: " + ", ".join(
+    sorted(_ALLOWED_CATEGORIES)
+)
+
+
+def _validate_category(cls, v: Optional[str]) -> Optional[str]:
+    """Validate that category is one of the allowed values.
+
+    Shared between PropertyCreate and PropertyUpdate so pydantic-core builds
+    one validator function instead of compiling a copy per model.
+    """
+    if v is None:
+        return v
+
+    # Clients overwhelmingly send canonical lowercase; skip the lower()
+    # allocation on that path
+    if v in _ALLOWED_CATEGORIES:
+        return v
+
+    v = v.lower()
+    if v not in _ALLOWED_CATEGORIES:
+        raise ValueError(_ALLOWED_CATEGORIES_MSG)
+    return v
+
+
+# OpenAPI example payload, retained only while examples are enabled
+_RESPONSE_EXAMPLE = {
+    "id": "123e4567-e89b-12d3-a456-426614174000",
+    "user_id": "123e4567-e89b-12d3-a456-426614174001",
+    "title": "Beautiful Apartment in Downtown",
+    "description": "A spacious apartment with great views.",
+    "category": "apartment",
+    "address": "123 Main St",
+    "city": "New York",
+    "state": "NY",
+    "zip_code": "10001",
+    "country": "USA",
+    "latitude": 40.7128,
+    "longitude": -74.0060,
+    "price": 500000.0,
+    "bedrooms": 2.0,
+    "bathrooms": 2.0,
+    "square_feet": 1200.0,
+    "year_built": 2010,
+    "features": ["hardwood floors", "stainless steel appliances"],
+    "is_published": True,
+    "created_at": "2023-01-01T00:00:00Z",
+    "updated_at": "2023-01-01T00:00:00Z",
+    "image_count": 3,
+    "primary_image_url": "https://example.com/image.jpg",
+}
+
+_RESPONSE_CONFIG = ConfigDict(
+    **RESPONSE_CONFIG,
+    # List endpoints build many of these per page: frozen +
+    # extra="forbid" gets leaner validators, hashable instances and
+    # skips the extras-preservation path during serialization
+    frozen=True,
+    extra="forbid",
+    json_schema_extra=(
+        {"example": _RESPONSE_EXAMPLE} if settings.ENABLE_OPENAPI_EXAMPLES else {}
+    ),
+)
 
 
 class PropertyBase(BaseModel):
@@ -34,18 +109,8 @@ class PropertyBase(BaseModel):
 
 class PropertyCreate(PropertyBase):
     """Schema for creating a new Property."""
-    
-    @field_validator('category')
-    @classmethod
-    def validate_category(cls, v: str) -> str:
-        """Validate that category is one of the allowed values."""
-        allowed_categories = [
-            "residential", "commercial", "land", "industrial", 
-            "apartment", "house", "condo", "townhouse", "other"
-        ]
-        if v.lower() not in allowed_categories:
-            raise ValueError(f"Category must be one of: {', '.join(allowed_categories)}")
-        return v.lower()
+
+    validate_category = field_validator('category')(classmethod(_validate_category))
 
 
 class PropertyUpdate(BaseModel):
@@ -68,21 +133,8 @@ class PropertyUpdate(BaseModel):
     year_built: Optional[int] = None
     features: Optional[List[str]] = None
     is_published: Optional[bool] = None
-    
-    @field_validator('category')
-    @classmethod
-    def validate_category(cls, v: Optional[str]) -> Optional[str]:
-        """Validate that category is one of the allowed values."""
-        if v is None:
-            return v
-            
-        allowed_categories = [
-            "residential", "commercial", "land", "industrial", 
-            "apartment", "house", "condo", "townhouse", "other"
-        ]
-        if v.lower() not in allowed_categories:
-            raise ValueError(f"Category must be one of: {', '.join(allowed_categories)}")
-        return v.lower()
+
+    validate_category = field_validator('category')(classmethod(_validate_category))
 
 
 class PropertyInDB(PropertyBase):
@@ -94,41 +146,11 @@ class PropertyInDB(PropertyBase):
     updated_at: datetime
 
 
-class PropertyResponse(PropertyInDB):
+class PropertyResponse(TrustedFromORM, PropertyInDB):
     """Schema for Property response data."""
     
     # Additional fields that might be calculated or joined
     image_count: Optional[int] = None
     primary_image_url: Optional[str] = None
     
-    class Config:
-        """Pydantic configuration."""
-        
-        from_attributes = True
-        json_schema_extra = {
-            "example": {
-                "id": "123e4567-e89b-12d3-a456-426614174000",
-                "user_id": "123e4567-e89b-12d3-a456-426614174001",
-                "title": "Beautiful Apartment in Downtown",
-                "description": "A spacious apartment with great views.",
-                "category": "apartment",
-                "address": "123 Main St",
-                "city": "New York",
-                "state": "NY",
-                "zip_code": "10001",
-                "country": "USA",
-                "latitude": 40.7128,
-                "longitude": -74.0060,
-                "price": 500000.0,
-                "bedrooms": 2.0,
-                "bathrooms": 2.0,
-                "square_feet": 1200.0,
-                "year_built": 2010,
-                "features": ["hardwood floors", "stainless steel appliances"],
-                "is_published": True,
-                "created_at": "2023-01-01T00:00:00Z",
-                "updated_at": "2023-01-01T00:00:00Z",
-                "image_count": 3,
-                "primary_image_url": "https://example.com/image.jpg",
-            }
-        }
+    model_config = _RESPONSE_CONFIG
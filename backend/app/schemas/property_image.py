@@ -7,7 +7,38 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.core.config import settings
+from app.schemas.base import RESPONSE_CONFIG, TrustedFromORM
+
+
+# OpenAPI example payload, retained only while examples are enabled
+_RESPONSE_EXAMPLE = {
+    "id": "123e4567-e89b-12d3-a456-426614174000",
+    "property_id": "123e4567-e89b-12d3-a456-426614174001",
+    "storage_path": "properties/123e4567-e89b-12d3-a456-426614174001/image.jpg",
+    "url": "https://example.com/image.jpg",
+    "caption": "Living room with great natural light",
+    "ai_generated_description": "A spacious living room with hardwood floors and large windows allowing natural light to flood the space.",
+    "voice_note_text": "This living room has been recently renovated with new hardwood floors.",
+    "voice_note_path": "properties/123e4567-e89b-12d3-a456-426614174001/voice_note.mp3",
+    "is_primary": True,
+    "created_at": "2023-01-01T00:00:00Z",
+    "updated_at": "2023-01-01T00:00:00Z",
+}
+
+_RESPONSE_CONFIG = ConfigDict(
+    **RESPONSE_CONFIG,
+    # List endpoints build many of these per page: frozen +
+    # extra="forbid" gets leaner validators, hashable instances and
+    # skips the extras-preservation path during serialization
+    frozen=True,
+    extra="forbid",
+    json_schema_extra=(
+        {"example": _RESPONSE_EXAMPLE} if settings.ENABLE_OPENAPI_EXAMPLES else {}
+    ),
+)
 
 
 class PropertyImageBase(BaseModel):
@@ -25,6 +56,14 @@ class PropertyImageCreate(PropertyImageBase):
     # after processing the uploaded image
 
 
+class PropertyImageRegister(PropertyImageBase):
+    """Schema for registering an image uploaded directly to storage."""
+
+    storage_path: str = Field(
+        ..., description="Storage path returned by the presign endpoint"
+    )
+
+
 class PropertyImageUpdate(BaseModel):
     """Schema for updating an existing PropertyImage."""
     
@@ -48,25 +87,7 @@ class PropertyImageInDB(PropertyImageBase):
     updated_at: datetime
 
 
-class PropertyImageResponse(PropertyImageInDB):
+class PropertyImageResponse(TrustedFromORM, PropertyImageInDB):
     """Schema for PropertyImage response data."""
     
-    class Config:
-        """Pydantic configuration."""
-        
-        from_attributes = True
-        json_schema_extra = {
-            "example": {
-                "id": "123e4567-e89b-12d3-a456-426614174000",
-                "property_id": "123e4567-e89b-12d3-a456-426614174001",
-                "storage_path": "properties/123e4567-e89b-12d3-a456-426614174001/image.jpg",
-                "url": "https://example.com/image.jpg",
-                "caption": "Living room with great natural light",
-                "ai_generated_description": "A spacious living room with hardwood floors and large windows allowing natural light to flood the space.",
-                "voice_note_text": "This living room has been recently renovated with new hardwood floors.",
-                "voice_note_path": "properties/123e4567-e89b-12d3-a456-426614174001/voice_note.mp3",
-                "is_primary": True,
-                "created_at": "2023-01-01T00:00:00Z",
-                "updated_at": "2023-01-01T00:00:00Z",
-            }
-        }
+    model_config = _RESPONSE_CONFIG
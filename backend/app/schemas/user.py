@@ -7,7 +7,33 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
+
+from app.core.config import settings
+from app.schemas.base import RESPONSE_CONFIG, TrustedFromORM
+
+# OpenAPI example payload, retained only while examples are enabled
+_RESPONSE_EXAMPLE = {
+    "id": "123e4567-e89b-12d3-a456-426614174000",
+    "supabase_id": "abcdef123456",
+    "email": "user@example.com",
+    "full_name": "John Doe",
+    "is_active": True,
+    "created_at": "2023-01-01T00:00:00Z",
+    "updated_at": "2023-01-01T00:00:00Z",
+}
+
+_RESPONSE_CONFIG = ConfigDict(
+    **RESPONSE_CONFIG,
+    # List endpoints build many of these per page: frozen +
+    # extra="forbid" gets leaner validators, hashable instances and
+    # skips the extras-preservation path during serialization
+    frozen=True,
+    extra="forbid",
+    json_schema_extra=(
+        {"example": _RESPONSE_EXAMPLE} if settings.ENABLE_OPENAPI_EXAMPLES else {}
+    ),
+)
 
 
 class UserBase(BaseModel):
@@ -20,8 +46,8 @@ class UserBase(BaseModel):
 
 class UserCreate(UserBase):
     """Schema for creating a new User."""
-    
-    supabase_id: str = Field(..., description="User ID from Supabase authentication")
+
+    password: str = Field(..., min_length=8, description="Password for email authentication")
 
 
 class UserUpdate(BaseModel):
@@ -31,26 +57,12 @@ class UserUpdate(BaseModel):
     is_active: Optional[bool] = None
 
 
-class UserResponse(UserBase):
+class UserResponse(TrustedFromORM, UserBase):
     """Schema for User response data."""
     
+    model_config = _RESPONSE_CONFIG
+
     id: UUID
-    supabase_id: str
+    supabase_id: Optional[str] = None
     created_at: datetime
     updated_at: datetime
-    
-    class Config:
-        """Pydantic configuration."""
-        
-        from_attributes = True
-        json_schema_extra = {
-            "example": {
-                "id": "123e4567-e89b-12d3-a456-426614174000",
-                "supabase_id": "abcdef123456",
-                "email": "user@example.com",
-                "full_name": "John Doe",
-                "is_active": True,
-                "created_at": "2023-01-01T00:00:00Z",
-                "updated_at": "2023-01-01T00:00:00Z",
-            }
-        }
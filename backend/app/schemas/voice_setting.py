@@ -3,11 +3,77 @@ VoiceSetting schemas for request and response validation.
 
 This module defines Pydantic models for VoiceSetting data validation and serialization.
 """
+import re
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from app.core.config import settings
+from app.schemas.base import RESPONSE_CONFIG, TrustedFromORM
+
+# Hoisted to module level so validation does one hashed membership check per
+# call instead of rebuilding the list and error string
+_ALLOWED_VOICE_TYPES = frozenset({"male", "female", "neutral"})
+
+# BCP-47-ish language code like en-US or en_US; one compiled-pattern pass
+# replaces the length check plus two substring scans
+_LANG_RE = re.compile(r"^[A-Za-z]{2,3}[-_][A-Za-z0-9]{2,8}$")
+_ALLOWED_VOICE_TYPES_MSG = "Voice type must be one of: " + ", ".join(
+    sorted(_ALLOWED_VOICE_TYPES)
+)
+
+
+def _validate_voice_type(cls, v: Optional[str]) -> Optional[str]:
+    """Validate that voice_type is one of the allowed values.
+
+    Shared between VoiceSettingBase and VoiceSettingUpdate so pydantic-core
+    builds one validator function instead of compiling a copy per model.
+    """
+    if v is None:
+        return v
+
+    # Clients overwhelmingly send canonical lowercase; skip the lower()
+    # allocation on that path
+    if v in _ALLOWED_VOICE_TYPES:
+        return v
+
+    v = v.lower()
+    if v not in _ALLOWED_VOICE_TYPES:
+        raise ValueError(_ALLOWED_VOICE_TYPES_MSG)
+    return v
+
+
+def _validate_voice_language(cls, v: Optional[str]) -> Optional[str]:
+    """Validate that voice_language is in a valid format."""
+    if v is None:
+        return v
+
+    if not _LANG_RE.match(v):
+        raise ValueError("Voice language must be in format 'en-US' or 'en_US'")
+    return v
+
+
+# OpenAPI example payload, retained only while examples are enabled
+_RESPONSE_EXAMPLE = {
+    "id": "123e4567-e89b-12d3-a456-426614174000",
+    "user_id": "123e4567-e89b-12d3-a456-426614174001",
+    "wake_word": "Rivo Start",
+    "voice_type": "female",
+    "voice_language": "en-US",
+    "is_enabled": True,
+    "volume": 0.7,
+    "created_at": "2023-01-01T00:00:00Z",
+    "updated_at": "2023-01-01T00:00:00Z",
+}
+
+_RESPONSE_CONFIG = ConfigDict(
+    **RESPONSE_CONFIG,
+    json_schema_extra=(
+        {"example": _RESPONSE_EXAMPLE} if settings.ENABLE_OPENAPI_EXAMPLES else {}
+    ),
+)
 
 
 class VoiceSettingBase(BaseModel):
@@ -18,23 +84,13 @@ class VoiceSettingBase(BaseModel):
     voice_language: str = Field(default="en-US", min_length=2, max_length=20)
     is_enabled: bool = True
     volume: float = Field(default=0.7, ge=0.0, le=1.0)
-    
-    @field_validator('voice_type')
-    @classmethod
-    def validate_voice_type(cls, v: str) -> str:
-        """Validate that voice_type is one of the allowed values."""
-        allowed_types = ["male", "female", "neutral"]
-        if v.lower() not in allowed_types:
-            raise ValueError(f"Voice type must be one of: {', '.join(allowed_types)}")
-        return v.lower()
-    
-    @field_validator('voice_language')
-    @classmethod
-    def validate_voice_language(cls, v: str) -> str:
-        """Validate that voice_language is in a valid format."""
-        if not (2 <= len(v) <= 20) or ("-" not in v and "_" not in v):
-            raise ValueError("Voice language must be in format 'en-US' or 'en_US'")
-        return v
+
+    validate_voice_type = field_validator('voice_type')(
+        classmethod(_validate_voice_type)
+    )
+    validate_voice_language = field_validator('voice_language')(
+        classmethod(_validate_voice_language)
+    )
 
 
 class VoiceSettingCreate(VoiceSettingBase):
@@ -51,29 +107,13 @@ class VoiceSettingUpdate(BaseModel):
     voice_language: Optional[str] = None
     is_enabled: Optional[bool] = None
     volume: Optional[float] = Field(None, ge=0.0, le=1.0)
-    
-    @field_validator('voice_type')
-    @classmethod
-    def validate_voice_type(cls, v: Optional[str]) -> Optional[str]:
-        """Validate that voice_type is one of the allowed values."""
-        if v is None:
-            return v
-            
-        allowed_types = ["male", "female", "neutral"]
-        if v.lower() not in allowed_types:
-            raise ValueError(f"Voice type must be one of: {', '.join(allowed_types)}")
-        return v.lower()
-    
-    @field_validator('voice_language')
-    @classmethod
-    def validate_voice_language(cls, v: Optional[str]) -> Optional[str]:
-        """Validate that voice_language is in a valid format."""
-        if v is None:
-            return v
-            
-        if not (2 <= len(v) <= 20) or ("-" not in v and "_" not in v):
-            raise ValueError("Voice language must be in format 'en-US' or 'en_US'")
-        return v
+
+    validate_voice_type = field_validator('voice_type')(
+        classmethod(_validate_voice_type)
+    )
+    validate_voice_language = field_validator('voice_language')(
+        classmethod(_validate_voice_language)
+    )
 
 
 class VoiceSettingInDB(VoiceSettingBase):
@@ -85,23 +125,7 @@ class VoiceSettingInDB(VoiceSettingBase):
     updated_at: datetime
 
 
-class VoiceSettingResponse(VoiceSettingInDB):
+class VoiceSettingResponse(TrustedFromORM, VoiceSettingInDB):
     """Schema for VoiceSetting response data."""
     
-    class Config:
-        """Pydantic configuration."""
-        
-        from_attributes = True
-        json_schema_extra = {
-            "example": {
-                "id": "123e4567-e89b-12d3-a456-426614174000",
-                "user_id": "123e4567-e89b-12d3-a456-426614174001",
-                "wake_word": "Rivo Start",
-                "voice_type": "female",
-                "voice_language": "en-US",
-                "is_enabled": True,
-                "volume": 0.7,
-                "created_at": "2023-01-01T00:00:00Z",
-                "updated_at": "2023-01-01T00:00:00Z",
-            }
-        }
+    model_config = _RESPONSE_CONFIG
@@ -5,6 +5,7 @@ This module provides functions to handle Google OAuth authentication flow.
 """
 import json
 from typing import Dict, Optional, Any
+from urllib.parse import quote
 
 import httpx
 from fastapi import HTTPException, status
@@ -19,30 +20,59 @@ GOOGLE_AUTH_URL = "https://accounts.google.com/o/oauth2/auth"
 GOOGLE_TOKEN_URL = "https://oauth2.googleapis.com/token"
 GOOGLE_USERINFO_URL = "https://www.googleapis.com/oauth2/v3/userinfo"
 
+# Shared HTTP client so the token-exchange and userinfo calls reuse one
+# keep-alive connection to Google instead of paying a TLS handshake each.
+_client: Optional[httpx.AsyncClient] = None
 
-async def get_google_auth_url(redirect_uri: str, state: str) -> str:
+
+def _get_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=5.0,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+    return _client
+
+
+async def aclose_client() -> None:
+    """Close the shared HTTP client (called on application shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+# Everything except redirect_uri and state is constant for the process, so
+# the base URL is assembled once at import and each call is pure formatting.
+_AUTH_URL_BASE = (
+    f"{GOOGLE_AUTH_URL}"
+    f"?client_id={quote(settings.GOOGLE_CLIENT_ID, safe='')}"
+    "&response_type=code"
+    "&scope=email%20profile"
+    "&access_type=offline"
+    "&prompt=consent"
+)
+
+
+def get_google_auth_url(redirect_uri: str, state: str) -> str:
     """
     Generate Google OAuth authorization URL.
-    
+
     Args:
         redirect_uri: URL to redirect to after authentication
         state: State parameter for CSRF protection
-        
+
     Returns:
         str: Google OAuth authorization URL
     """
-    params = {
-        "client_id": settings.google_client_id,
-        "redirect_uri": redirect_uri,
-        "response_type": "code",
-        "scope": "email profile",
-        "access_type": "offline",
-        "prompt": "consent",
-        "state": state
-    }
-    
-    query_string = "&".join([f"{k}={v}" for k, v in params.items()])
-    return f"{GOOGLE_AUTH_URL}?{query_string}"
+    return (
+        f"{_AUTH_URL_BASE}"
+        f"&redirect_uri={quote(redirect_uri, safe='')}"
+        f"&state={quote(state, safe='')}"
+    )
 
 
 async def exchange_code_for_token(code: str, redirect_uri: str) -> Dict[str, Any]:
@@ -60,26 +90,25 @@ async def exchange_code_for_token(code: str, redirect_uri: str) -> Dict[str, Any
         HTTPException: If token exchange fails
     """
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                GOOGLE_TOKEN_URL,
-                data={
-                    "client_id": settings.google_client_id,
-                    "client_secret": settings.google_client_secret,
-                    "code": code,
-                    "redirect_uri": redirect_uri,
-                    "grant_type": "authorization_code"
-                }
+        response = await _get_client().post(
+            GOOGLE_TOKEN_URL,
+            data={
+                "client_id": settings.GOOGLE_CLIENT_ID,
+                "client_secret": settings.GOOGLE_CLIENT_SECRET,
+                "code": code,
+                "redirect_uri": redirect_uri,
+                "grant_type": "authorization_code"
+            }
+        )
+
+        if response.status_code != 200:
+            logger.error(f"Google token exchange failed: {response.text}")
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Failed to exchange code for token"
             )
-            
-            if response.status_code != 200:
-                logger.error(f"Google token exchange failed: {response.text}")
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Failed to exchange code for token"
-                )
-                
-            return response.json()
+
+        return response.json()
     except Exception as e:
         logger.error(f"Error exchanging code for token: {str(e)}")
         raise HTTPException(
@@ -102,20 +131,19 @@ async def get_google_user_info(access_token: str) -> Dict[str, Any]:
         HTTPException: If user info retrieval fails
     """
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                GOOGLE_USERINFO_URL,
-                headers={"Authorization": f"Bearer {access_token}"}
+        response = await _get_client().get(
+            GOOGLE_USERINFO_URL,
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+
+        if response.status_code != 200:
+            logger.error(f"Google user info retrieval failed: {response.text}")
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Failed to retrieve user information"
             )
-            
-            if response.status_code != 200:
-                logger.error(f"Google user info retrieval failed: {response.text}")
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Failed to retrieve user information"
-                )
-                
-            return response.json()
+
+        return response.json()
     except Exception as e:
         logger.error(f"Error retrieving Google user info: {str(e)}")
         raise HTTPException(
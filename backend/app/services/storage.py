@@ -1,147 +1,284 @@
 """
-Storage service for handling file uploads to S3 or Supabase Storage.
+Storage service for handling file uploads to S3 storage.
 
-This module provides functions to upload, retrieve, and manage files in cloud storage.
+This module provides the StorageService class used to upload, retrieve, and
+manage files in cloud storage. The service is intended to be shared
+process-wide (see `app.api.deps.get_storage_service`) so the boto3 client and
+its connection pool are created once, not per request.
 """
-import os
+import asyncio
+import threading
 import uuid
-from typing import Any, BinaryIO, Dict, Optional
+from typing import Optional
 
 import boto3
-from fastapi import UploadFile
+from boto3.s3.transfer import TransferConfig
+from cachetools import TTLCache
+from fastapi import HTTPException, UploadFile, status
 
 from app.core.config import settings
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
-# Initialize S3 client
-s3_client = boto3.client(
-    "s3",
-    aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-    aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-    region_name=settings.AWS_REGION,
+# Stream uploads in 1 MiB parts so peak memory per upload is bounded by the
+# part size instead of the file size
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=1 << 20,
+    multipart_chunksize=1 << 20,
 )
 
+# Pre-signed URLs for hot keys (e.g. thumbnails on list pages) are reused
+# rather than re-running botocore's SigV4 HMAC chain per call. The TTL is
+# half the default expiration so a cached URL never expires in flight. The
+# lock is needed because signing runs from to_thread worker threads.
+_url_cache: TTLCache = TTLCache(maxsize=4096, ttl=1800)
+_url_cache_lock = threading.Lock()
 
-async def upload_file(
-    file: UploadFile,
-    folder: str = "uploads",
-    custom_filename: Optional[str] = None,
-) -> Dict[str, Any]:
+
+class _CountingStream:
     """
-    Upload a file to S3 storage.
-    
-    Args:
-        file: File to upload
-        folder: Folder path within the bucket
-        custom_filename: Optional custom filename
-        
-    Returns:
-        Dict[str, Any]: Dictionary containing file information
+    File-like wrapper that counts bytes as boto3 reads them.
+
+    Lets the upload report its size from the same single streaming pass, so
+    no second read (or full-file buffer) is needed just to measure length.
     """
-    try:
-        # Generate a unique filename if not provided
-        if custom_filename:
-            filename = custom_filename
-        else:
-            # Get file extension
-            _, ext = os.path.splitext(file.filename)
-            # Generate unique filename
-            filename = f"{uuid.uuid4()}{ext}"
-        
-        # Create full path
-        file_path = f"{folder}/{filename}"
-        
-        logger.info(f"Uploading file to {file_path}")
-        
-        # Read file content
-        file_content = await file.read()
-        
-        # Upload to S3
-        s3_client.put_object(
-            Bucket=settings.AWS_BUCKET_NAME,
-            Key=file_path,
-            Body=file_content,
-            ContentType=file.content_type,
-        )
-        
-        # Generate public URL
-        file_url = f"https://{settings.AWS_BUCKET_NAME}.s3.{settings.AWS_REGION}.amazonaws.com/{file_path}"
-        
-        logger.info(f"File uploaded successfully: {file_url}")
-        
-        return {
-            "filename": filename,
-            "content_type": file.content_type,
-            "size": len(file_content),
-            "path": file_path,
-            "url": file_url,
-        }
-        
-    except Exception as e:
-        logger.error(f"Error uploading file: {str(e)}")
-        raise
-    finally:
-        # Reset file pointer for potential reuse
-        await file.seek(0)
-
-
-async def delete_file(file_path: str) -> bool:
+
+    def __init__(self, fileobj, max_bytes: Optional[int] = None):
+        self.fileobj = fileobj
+        self.bytes_read = 0
+        self.max_bytes = max_bytes
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self.fileobj.read(size)
+        self.bytes_read += len(chunk)
+        # Backstop for clients that lie about (or omit) Content-Length: abort
+        # the transfer as soon as the cap is crossed instead of buffering on
+        if self.max_bytes is not None and self.bytes_read > self.max_bytes:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail="File exceeds the maximum upload size",
+            )
+        return chunk
+
+
+class StorageService:
     """
-    Delete a file from S3 storage.
-    
-    Args:
-        file_path: Path to the file within the bucket
-        
-    Returns:
-        bool: True if deletion was successful
+    Service wrapping S3 storage.
+
+    A single instance holds one boto3 S3 client, which is thread-safe and
+    reuses its connection pool between requests.
     """
-    try:
-        logger.info(f"Deleting file: {file_path}")
-        
-        # Delete from S3
-        s3_client.delete_object(
-            Bucket=settings.AWS_BUCKET_NAME,
-            Key=file_path,
+
+    def __init__(
+        self,
+        aws_access_key_id: Optional[str] = None,
+        aws_secret_access_key: Optional[str] = None,
+        aws_region: Optional[str] = None,
+        aws_bucket_name: Optional[str] = None,
+    ):
+        """
+        Initialize the service with a shared S3 client.
+
+        Args:
+            aws_access_key_id: AWS access key; defaults to the configured key
+            aws_secret_access_key: AWS secret key; defaults to the configured key
+            aws_region: AWS region; defaults to the configured region
+            aws_bucket_name: S3 bucket name; defaults to the configured bucket
+        """
+        self.bucket_name = aws_bucket_name or settings.AWS_BUCKET_NAME
+        self.region = aws_region or settings.AWS_REGION
+        self.s3_client = boto3.client(
+            "s3",
+            aws_access_key_id=aws_access_key_id or settings.AWS_ACCESS_KEY_ID,
+            aws_secret_access_key=aws_secret_access_key or settings.AWS_SECRET_ACCESS_KEY,
+            region_name=self.region,
         )
-        
-        logger.info(f"File deleted successfully: {file_path}")
-        
-        return True
-        
-    except Exception as e:
-        logger.error(f"Error deleting file: {str(e)}")
-        return False
 
+    async def upload_file(
+        self,
+        file: UploadFile,
+        storage_path: Optional[str] = None,
+        folder: str = "uploads",
+    ) -> str:
+        """
+        Upload a file to S3 storage.
 
-async def get_file_url(file_path: str, expiration: int = 3600) -> str:
-    """
-    Generate a pre-signed URL for accessing a file.
-    
-    Args:
-        file_path: Path to the file within the bucket
-        expiration: URL expiration time in seconds
-        
-    Returns:
-        str: Pre-signed URL for file access
-    """
-    try:
-        logger.info(f"Generating pre-signed URL for: {file_path}")
-        
-        # Generate pre-signed URL
-        url = s3_client.generate_presigned_url(
-            "get_object",
-            Params={
-                "Bucket": settings.AWS_BUCKET_NAME,
-                "Key": file_path,
-            },
+        Args:
+            file: File to upload
+            storage_path: Full destination path within the bucket; if omitted,
+                a unique filename is generated under `folder`
+            folder: Folder path within the bucket when no storage_path is given
+
+        Returns:
+            str: Public URL of the uploaded file
+
+        Raises:
+            HTTPException: 413 if the file exceeds MAX_UPLOAD_BYTES
+        """
+        # Fail fast on the declared size before reading a single byte;
+        # the counting stream below catches clients that under-declare
+        max_bytes = settings.MAX_UPLOAD_BYTES
+        if file.size is not None and file.size > max_bytes:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail="File exceeds the maximum upload size",
+            )
+
+        try:
+            if storage_path:
+                file_path = storage_path
+            else:
+                # Generate a unique filename preserving the extension; a bare
+                # rfind avoids os.path's normalization, and .hex skips the
+                # dash-formatting pass of str(uuid4)
+                name = file.filename or ""
+                dot = name.rfind(".")
+                ext = name[dot:] if dot > 0 else ""
+                file_path = f"{folder}/{uuid.uuid4().hex}{ext}"
+
+            logger.info(f"Uploading file to {file_path}")
+
+            # Stream the file to S3 in parts instead of reading it all into
+            # memory; boto3 pulls chunks from the spooled temp file directly.
+            # boto3 is blocking, so the whole round trip runs in a worker
+            # thread to keep the event loop free for other requests.
+            stream = _CountingStream(file.file, max_bytes=max_bytes)
+            await asyncio.to_thread(
+                self.s3_client.upload_fileobj,
+                stream,
+                self.bucket_name,
+                file_path,
+                ExtraArgs={"ContentType": file.content_type},
+                Config=_TRANSFER_CONFIG,
+            )
+
+            # Generate public URL
+            file_url = self.public_url(file_path)
+
+            logger.info(
+                f"File uploaded successfully ({stream.bytes_read} bytes): {file_url}"
+            )
+
+            return file_url
+
+        except Exception as e:
+            logger.error(f"Error uploading file: {str(e)}")
+            raise
+        finally:
+            # Reset file pointer for potential reuse
+            await file.seek(0)
+
+    async def delete_file(self, file_path: str) -> bool:
+        """
+        Delete a file from S3 storage.
+
+        Args:
+            file_path: Path to the file within the bucket
+
+        Returns:
+            bool: True if deletion was successful
+        """
+        try:
+            logger.info(f"Deleting file: {file_path}")
+
+            # Delete from S3 (blocking boto3 call, so off the event loop)
+            await asyncio.to_thread(
+                self.s3_client.delete_object,
+                Bucket=self.bucket_name,
+                Key=file_path,
+            )
+
+            logger.info(f"File deleted successfully: {file_path}")
+
+            return True
+
+        except Exception as e:
+            logger.error(f"Error deleting file: {str(e)}")
+            return False
+
+    def presign_upload(self, file_path: str, expiration: int = 3600) -> dict:
+        """
+        Create a pre-signed POST so clients upload directly to S3.
+
+        The API never proxies the file bytes; it only hands out the signed
+        form and later records the resulting storage path.
+
+        Args:
+            file_path: Destination path within the bucket
+            expiration: Signature validity in seconds
+
+        Returns:
+            dict: ``url`` and ``fields`` for the client's multipart POST
+        """
+        logger.info(f"Presigning upload for: {file_path}")
+
+        return self.s3_client.generate_presigned_post(
+            Bucket=self.bucket_name,
+            Key=file_path,
             ExpiresIn=expiration,
         )
-        
-        return url
-        
-    except Exception as e:
-        logger.error(f"Error generating pre-signed URL: {str(e)}")
-        # Return public URL as fallback
-        return f"https://{settings.AWS_BUCKET_NAME}.s3.{settings.AWS_REGION}.amazonaws.com/{file_path}"
+
+    async def file_exists(self, file_path: str) -> bool:
+        """
+        Check whether a file exists in the bucket.
+
+        Args:
+            file_path: Path to the file within the bucket
+
+        Returns:
+            bool: True if the object exists
+        """
+        try:
+            # head_object is a full S3 round trip; run it in a worker thread
+            await asyncio.to_thread(
+                self.s3_client.head_object, Bucket=self.bucket_name, Key=file_path
+            )
+            return True
+        except Exception:
+            return False
+
+    async def get_file_url(self, file_path: str, expiration: int = 3600) -> str:
+        """
+        Generate a pre-signed URL for accessing a file.
+
+        Args:
+            file_path: Path to the file within the bucket
+            expiration: URL expiration time in seconds
+
+        Returns:
+            str: Pre-signed URL for file access
+        """
+        cache_key = (self.bucket_name, file_path, expiration)
+        with _url_cache_lock:
+            cached = _url_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            logger.info(f"Generating pre-signed URL for: {file_path}")
+
+            # Generate pre-signed URL
+            url = await asyncio.to_thread(
+                self.s3_client.generate_presigned_url,
+                "get_object",
+                Params={
+                    "Bucket": self.bucket_name,
+                    "Key": file_path,
+                },
+                ExpiresIn=expiration,
+            )
+
+            with _url_cache_lock:
+                _url_cache[cache_key] = url
+
+            return url
+
+        except Exception as e:
+            logger.error(f"Error generating pre-signed URL: {str(e)}")
+            # Return public URL as fallback
+            return self.public_url(file_path)
+
+    def public_url(self, file_path: str) -> str:
+        """Build the public HTTPS URL for a file within the bucket."""
+        return f"https://{self.bucket_name}.s3.{self.region}.amazonaws.com/{file_path}"
@@ -4,25 +4,130 @@ Supabase service for authentication and storage.
 This module provides functions to interact with Supabase for authentication
 and token validation.
 """
-from typing import Any, Dict, Optional
+import asyncio
+import hashlib
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-import httpx
-from fastapi import Depends, HTTPException, status
+import orjson
+from cachetools import TTLCache
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError, jwt
+import jwt
+from jwt import ExpiredSignatureError, InvalidTokenError
 
 from app.core.config import settings
 from app.core.logging import get_logger
 
+if TYPE_CHECKING:
+    import httpx
+
 logger = get_logger(__name__)
 
 # Set up security scheme for JWT authentication
 security = HTTPBearer()
 
+# Shared HTTP client so token verifications reuse keep-alive connections to
+# the Supabase auth endpoint instead of paying a TCP+TLS handshake per call;
+# with HTTP/2 parallel verifications multiplex on one connection.
+_client: Optional["httpx.AsyncClient"] = None
+
+
+def _get_client() -> "httpx.AsyncClient":
+    """Get the shared HTTP client, creating it on first use."""
+    global _client
+    if _client is None:
+        # Imported lazily: the hot local-decode path never touches httpx,
+        # and deferring its transitive imports (httpcore, anyio, h11)
+        # shortens cold start for short-lived workers and test runs
+        import httpx
+
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=5.0,
+            limits=httpx.Limits(
+                max_connections=120, max_keepalive_connections=80
+            ),
+        )
+    return _client
+
+
+async def aclose_client() -> None:
+    """Close the shared HTTP client (called on application shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+# Bound once at import: these never change after startup, and reading them
+# from module globals skips Pydantic's attribute machinery on every request
+# encoded to bytes up front so the library does not re-encode per decode
+_JWT_SECRET = settings.SUPABASE_JWT_SECRET.encode()
+_ALGORITHMS = [settings.ALGORITHM]
+# exp presence and freshness are enforced inside the decode itself, so no
+# separate post-decode check is needed
+_DECODE_OPTIONS = {"verify_aud": False, "verify_exp": True, "require": ["exp"]}
+# Remote-verification endpoint and its constant header, assembled once so
+# each call only formats the Authorization value
+_USER_URL = f"{settings.SUPABASE_URL}/auth/v1/user"
+_BASE_HEADERS = {"apikey": settings.SUPABASE_KEY}
+
+# Short-lived cache of verified users, keyed by a digest of the token
+# (never the raw token, so memory dumps don't leak bearers). Clients reuse
+# the same token for ~1h, so repeat requests skip the HMAC verify, the JSON
+# parse and the SupabaseUser construction entirely. Same pattern as
+# app.core.security._payload_cache, but storing the ready-to-use object.
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
+# Coalescing state for remote verification: concurrent calls for the same
+# token (keyed by digest, never the raw token) share one in-flight request,
+# and the semaphore bounds how many distinct verifications hit Supabase at
+# once so a burst cannot exhaust the egress pool.
+_inflight: Dict[bytes, "asyncio.Future[Optional[Dict[str, Any]]]"] = {}
+_verify_semaphore = asyncio.Semaphore(32)
+
+
+def _decode_token(token: str) -> "SupabaseUser":
+    """
+    Decode and verify a Supabase JWT, caching the verified user briefly.
+
+    Args:
+        token: JWT token to decode
+
+    Returns:
+        SupabaseUser: User built from the verified token payload
+
+    Raises:
+        InvalidTokenError: If the token is invalid or expired
+    """
+    cache_key = hashlib.sha256(token.encode()).digest()
+
+    user = _user_cache.get(cache_key)
+    if user is not None:
+        # Never serve a cached user past the token's own expiry
+        if user.raw_data.get("exp", 0) > time.time():
+            return user
+        del _user_cache[cache_key]
+        raise ExpiredSignatureError("Token has expired")
+
+    payload = jwt.decode(
+        token,
+        _JWT_SECRET,
+        algorithms=_ALGORITHMS,
+        options=_DECODE_OPTIONS,
+    )
+    user = SupabaseUser(payload)
+    _user_cache[cache_key] = user
+    return user
+
 
 class SupabaseUser:
     """Class representing a Supabase authenticated user."""
-    
+
+    # One instance per authenticated request: slots skip the per-instance
+    # __dict__ allocation and make attribute access a fixed-offset read
+    __slots__ = ("id", "email", "role", "app_metadata", "user_metadata", "raw_data")
+
     def __init__(self, user_data: Dict[str, Any]):
         """Initialize user with data from Supabase JWT."""
         self.id: str = user_data.get("sub", "")
@@ -33,79 +138,156 @@ class SupabaseUser:
         self.raw_data: Dict[str, Any] = user_data
 
 
-async def get_current_user(
+async def _decode_jwt(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
 ) -> SupabaseUser:
     """
-    Validate JWT token and return the current user.
-    
+    Validate the bearer token and return the verified user.
+
+    Kept as its own dependency so FastAPI's per-request cache (the default
+    `use_cache=True` — do not disable it on these) resolves the decode exactly
+    once per request, no matter how many downstream dependencies pull the
+    current user. The result is also mirrored on `request.state.user`, so
+    middleware running before routing can resolve the user itself (or read
+    it afterwards) without triggering a second decode.
+
     Args:
+        request: Current request, used to share the user via request.state
         credentials: HTTP Authorization credentials containing the JWT token
-        
+
     Returns:
-        SupabaseUser: Current authenticated user
-        
+        SupabaseUser: User built from the verified token payload
+
     Raises:
         HTTPException: If token is invalid or expired
     """
+    user = getattr(request.state, "user", None)
+    if user is not None:
+        return user
+
     try:
-        token = credentials.credentials
-        payload = jwt.decode(
-            token,
-            settings.SUPABASE_JWT_SECRET,
-            algorithms=[settings.ALGORITHM],
-            options={"verify_aud": False},
-        )
-        
-        logger.debug(f"JWT payload: {payload}")
-        
-        # Verify token has not expired
-        if payload.get("exp") is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Token has no expiration",
-            )
-        
-        # Create and return user object
-        return SupabaseUser(payload)
-        
-    except JWTError as e:
+        user = _decode_token(credentials.credentials)
+    except InvalidTokenError as e:
         logger.error(f"JWT validation error: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
         )
 
+    logger.debug(f"JWT payload: {user.raw_data}")
+
+    request.state.user = user
+    return user
+
+
+async def get_current_user(
+    user: SupabaseUser = Depends(_decode_jwt),
+) -> SupabaseUser:
+    """
+    Return the current authenticated user.
+
+    Always reference this via `Depends(get_current_user)` — never call it
+    directly — so the per-request dependency cache fires.
+
+    Args:
+        user: Verified user from `_decode_jwt`
+
+    Returns:
+        SupabaseUser: Current authenticated user
+
+    Raises:
+        HTTPException: If token is invalid or expired
+    """
+    return user
+
+
+async def verify_supabase_token_cached(
+    token: str, force_remote: bool = False
+) -> Optional[Dict[str, Any]]:
+    """
+    Verify a Supabase token locally, falling back to the Auth API.
+
+    HS256 tokens are symmetric, so the local decode is already
+    authoritative; the network round trip only adds revocation freshness,
+    which short token lifetimes already bound. Prefer this over
+    `verify_supabase_token` unless an explicit revocation check is needed.
+
+    Args:
+        token: JWT token to verify
+        force_remote: Skip the local decode and always ask the Auth API
+
+    Returns:
+        Optional[Dict[str, Any]]: Token claims (or user data when verified
+            remotely) if the token is valid, None otherwise
+    """
+    if not force_remote:
+        try:
+            return _decode_token(token).raw_data
+        except InvalidTokenError:
+            # Malformed or expired locally; the remote call is the final word
+            pass
+
+    return await verify_supabase_token(token)
+
 
 async def verify_supabase_token(token: str) -> Optional[Dict[str, Any]]:
     """
     Verify a Supabase token by calling the Supabase Auth API.
-    
+
+    This costs a full HTTP round trip per call; it exists for explicit
+    revocation checks. Routine verification should go through
+    `verify_supabase_token_cached`, which decodes locally.
+
     Args:
         token: JWT token to verify
-        
+
     Returns:
         Dict[str, Any]: User data if token is valid
-        
+
     Raises:
         HTTPException: If token is invalid or verification fails
     """
+    key = hashlib.sha256(token.encode()).digest()
+
+    # Coalesce: concurrent verifications of the same token await the call
+    # that is already in flight instead of each firing their own GET
+    pending = _inflight.get(key)
+    if pending is not None:
+        return await pending
+
+    future: "asyncio.Future[Optional[Dict[str, Any]]]" = (
+        asyncio.get_running_loop().create_future()
+    )
+    _inflight[key] = future
+    try:
+        async with _verify_semaphore:
+            result = await _verify_remote(token)
+        future.set_result(result)
+        return result
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    finally:
+        _inflight.pop(key, None)
+
+
+async def _verify_remote(token: str) -> Optional[Dict[str, Any]]:
+    """Call the Supabase Auth API to verify a token."""
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{settings.SUPABASE_URL}/auth/v1/user",
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "apikey": settings.SUPABASE_KEY,
-                },
-            )
-            
-            if response.status_code != 200:
-                logger.error(f"Supabase token verification failed: {response.text}")
-                return None
-            
-            return response.json()
-            
+        response = await _get_client().get(
+            _USER_URL,
+            headers={"Authorization": f"Bearer {token}", **_BASE_HEADERS},
+        )
+
+        if response.status_code != 200:
+            logger.error(f"Supabase token verification failed: {response.text}")
+            return None
+
+        # Parse the user object with orjson rather than httpx's stdlib-json
+        # default; the C parser is several times faster on these payloads
+        return orjson.loads(response.content)
+
     except Exception as e:
         logger.error(f"Error verifying Supabase token: {str(e)}")
         return None
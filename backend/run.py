@@ -4,16 +4,25 @@ Entry point script for running the application.
 This script provides a convenient way to run the application
 with uvicorn server.
 """
+import os
+
 import uvicorn
 
 from app.core.config import settings
 
 if __name__ == "__main__":
     """Run the application with uvicorn server."""
+    dev_mode = settings.ENVIRONMENT != "production"
+
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
-        port=settings.api_port,
-        reload=settings.environment != "production",
+        port=settings.API_PORT,
         log_level="info",
+        # libuv event loop and C HTTP parser; both are pure drop-ins
+        loop="uvloop",
+        http="httptools",
+        reload=dev_mode,
+        # reload and multiple workers are mutually exclusive in uvicorn
+        workers=1 if dev_mode else 2 * (os.cpu_count() or 1) + 1,
     )
@@ -3,88 +3,160 @@ Tests for the authentication endpoints.
 
 This module contains tests for the authentication API endpoints.
 """
+import uuid
+
 import pytest
 from fastapi import status
-from unittest.mock import AsyncMock, patch
 
+from app.core.security import create_access_token, get_password_hash
 from app.models.user import User
-from app.schemas.user import UserCreate
 
 
 @pytest.mark.asyncio
-async def test_register_user(client, test_db, mock_supabase_user):
-    """Test registering a new user."""
-    # Mock the get_current_user dependency
-    with patch("app.api.endpoints.auth.get_current_user", return_value=AsyncMock(
-        id=mock_supabase_user["id"],
-        email=mock_supabase_user["email"],
-        user_metadata=mock_supabase_user["user_metadata"],
-    )):
-        # Send registration request
-        response = await client.post(
-            "/api/auth/register",
-            json={
-                "email": mock_supabase_user["email"],
-                "full_name": mock_supabase_user["user_metadata"]["full_name"],
-                "supabase_id": mock_supabase_user["id"],
-            },
-        )
-        
-        # Check response
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert data["email"] == mock_supabase_user["email"]
-        assert data["full_name"] == mock_supabase_user["user_metadata"]["full_name"]
-        assert "id" in data
-        assert "created_at" in data
-        assert "updated_at" in data
+async def test_register_user(client, test_db):
+    """Test registering a new user with email and password."""
+    # Send registration request
+    response = await client.post(
+        "/api/auth/register",
+        json={
+            "email": "test@example.com",
+            "full_name": "Test User",
+            "password": "secret-password",
+        },
+    )
+
+    # Check response
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert "access_token" in data
+    assert "refresh_token" in data
+    assert data["token_type"] == "bearer"
 
 
 @pytest.mark.asyncio
-async def test_get_current_user_info(client, test_db, mock_supabase_user):
+async def test_register_user_duplicate_email(client, test_db):
+    """Test registering a user with an already registered email."""
+    # Create a user in the database
+    user = User(
+        email="test@example.com",
+        full_name="Test User",
+        hashed_password=get_password_hash("secret-password"),
+    )
+    test_db.add(user)
+    await test_db.commit()
+
+    # Send registration request with the same email
+    response = await client.post(
+        "/api/auth/register",
+        json={
+            "email": "test@example.com",
+            "full_name": "Another User",
+            "password": "other-password",
+        },
+    )
+
+    # Check response
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    data = response.json()
+    assert data["detail"] == "Email already registered"
+
+
+@pytest.mark.asyncio
+async def test_login(client, test_db):
+    """Test logging in with email and password."""
+    # Create a user in the database
+    user = User(
+        email="test@example.com",
+        full_name="Test User",
+        hashed_password=get_password_hash("secret-password"),
+    )
+    test_db.add(user)
+    await test_db.commit()
+
+    # Send login request
+    response = await client.post(
+        "/api/auth/login",
+        data={
+            "username": "test@example.com",
+            "password": "secret-password",
+        },
+    )
+
+    # Check response
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert "access_token" in data
+    assert "refresh_token" in data
+    assert data["token_type"] == "bearer"
+
+
+@pytest.mark.asyncio
+async def test_login_wrong_password(client, test_db):
+    """Test logging in with an incorrect password."""
+    # Create a user in the database
+    user = User(
+        email="test@example.com",
+        full_name="Test User",
+        hashed_password=get_password_hash("secret-password"),
+    )
+    test_db.add(user)
+    await test_db.commit()
+
+    # Send login request with the wrong password
+    response = await client.post(
+        "/api/auth/login",
+        data={
+            "username": "test@example.com",
+            "password": "wrong-password",
+        },
+    )
+
+    # Check response
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_info(client, test_db):
     """Test getting current user information."""
     # Create a user in the database
     user = User(
-        email=mock_supabase_user["email"],
-        full_name=mock_supabase_user["user_metadata"]["full_name"],
-        supabase_id=mock_supabase_user["id"],
+        email="test@example.com",
+        full_name="Test User",
+        hashed_password=get_password_hash("secret-password"),
     )
     test_db.add(user)
     await test_db.commit()
-    
-    # Mock the get_current_user dependency
-    with patch("app.api.endpoints.auth.get_current_user", return_value=AsyncMock(
-        id=mock_supabase_user["id"],
-        email=mock_supabase_user["email"],
-        user_metadata=mock_supabase_user["user_metadata"],
-    )):
-        # Send request to get current user info
-        response = await client.get("/api/auth/me")
-        
-        # Check response
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert data["email"] == mock_supabase_user["email"]
-        assert data["full_name"] == mock_supabase_user["user_metadata"]["full_name"]
-        assert "id" in data
-        assert "created_at" in data
-        assert "updated_at" in data
+    await test_db.refresh(user)
+
+    # Send request to get current user info with a valid token
+    token = create_access_token({"sub": str(user.id)})
+    response = await client.get(
+        "/api/auth/me",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    # Check response
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["email"] == "test@example.com"
+    assert data["full_name"] == "Test User"
+    assert "id" in data
+    assert "created_at" in data
+    assert "updated_at" in data
 
 
 @pytest.mark.asyncio
-async def test_get_current_user_info_not_found(client, test_db, mock_supabase_user):
+async def test_get_current_user_info_not_found(client, test_db):
     """Test getting current user information when user not found."""
-    # Mock the get_current_user dependency
-    with patch("app.api.endpoints.auth.get_current_user", return_value=AsyncMock(
-        id=mock_supabase_user["id"],
-        email=mock_supabase_user["email"],
-        user_metadata=mock_supabase_user["user_metadata"],
-    )):
-        # Send request to get current user info
-        response = await client.get("/api/auth/me")
-        
-        # Check response
-        assert response.status_code == status.HTTP_404_NOT_FOUND
-        data = response.json()
-        assert "detail" in data
-        assert data["detail"] == "User not found in database"
+    # Send request with a token for a user that does not exist
+    token = create_access_token({"sub": str(uuid.uuid4())})
+    response = await client.get(
+        "/api/auth/me",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    # Check response
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    data = response.json()
+    assert "detail" in data
+    assert data["detail"] == "User not found"
@@ -10,9 +10,9 @@ import pytest
 import pytest_asyncio
 from fastapi import FastAPI
 from httpx import AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import StaticPool
 
 from app.core.config import settings
 from app.db.base import Base
@@ -43,9 +43,23 @@ async def test_engine():
         TEST_DATABASE_URL,
         echo=False,
         future=True,
-        poolclass=NullPool,
+        # A single shared connection so the in-memory database outlives
+        # individual checkouts.
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
     )
-    
+
+    # The sqlite driver implicitly commits before SAVEPOINT, which would
+    # break the per-test rollback below; take over transaction control as
+    # documented in SQLAlchemy's "serializable isolation / savepoints" notes
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_implicit_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     # Create all tables
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -63,16 +77,26 @@ async def test_engine():
 async def test_db(test_engine) -> AsyncGenerator[AsyncSession, None]:
     """
     Create a test database session.
+
+    Each test joins one outer transaction on a dedicated connection; commits
+    inside the test land on SAVEPOINTs, and the outer transaction is rolled
+    back wholesale on teardown, so no per-table DELETE pass is needed to keep
+    tests isolated.
     """
-    # Create a new session for each test
-    async_session = sessionmaker(
-        test_engine, class_=AsyncSession, expire_on_commit=False
+    conn = await test_engine.connect()
+    trans = await conn.begin()
+    session = AsyncSession(
+        bind=conn,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
     )
-    
-    async with async_session() as session:
+
+    try:
         yield session
-        # Roll back any changes made during the test
-        await session.rollback()
+    finally:
+        await session.close()
+        await trans.rollback()
+        await conn.close()
 
 
 @pytest_asyncio.fixture(scope="function")
@@ -82,9 +106,14 @@ async def app(test_db) -> FastAPI:
     """
     app = create_application()
     
-    # Override the get_db dependency to use the test database
+    # Override the get_db dependency to use the test database, mirroring the
+    # request-scoped transaction that the real get_db wraps around handlers
     async def override_get_db():
-        yield test_db
+        # Close out any transaction the test itself left open (reads autobegin)
+        if test_db.in_transaction():
+            await test_db.commit()
+        async with test_db.begin():
+            yield test_db
     
     app.dependency_overrides[get_db] = override_get_db
     
@@ -96,19 +125,26 @@ async def client(app) -> AsyncGenerator[AsyncClient, None]:
     """
     Create a test client for the FastAPI application.
     """
-    async with AsyncClient(app=app, base_url=f"http://test{settings.api_prefix}") as client:
+    async with AsyncClient(app=app, base_url=f"http://test{settings.API_PREFIX}") as client:
         yield client
 
 
-@pytest_asyncio.fixture(scope="function")
-async def mock_supabase_user():
+# Built once; tests treat it as read-only
+MOCK_SUPABASE_USER = {
+    "id": "test-supabase-id",
+    "email": "test@example.com",
+    "user_metadata": {
+        "full_name": "Test User",
+    },
+}
+
+
+@pytest.fixture(scope="session")
+def mock_supabase_user():
     """
-    Create a mock Supabase user for testing.
+    Provide the mock Supabase user for testing.
+
+    Session-scoped and sync: the dict is a constant, so there is no per-test
+    coroutine to spin up and tear down.
     """
-    return {
-        "id": "test-supabase-id",
-        "email": "test@example.com",
-        "user_metadata": {
-            "full_name": "Test User",
-        },
-    }
+    return MOCK_SUPABASE_USER
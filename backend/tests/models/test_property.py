@@ -8,6 +8,8 @@ from datetime import datetime
 
 import pytest
 from sqlalchemy import select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import raiseload, selectinload
 
 from app.models.property import Property
 from app.models.user import User
@@ -16,19 +18,15 @@ from app.models.user import User
 @pytest.mark.asyncio
 async def test_create_property(test_db):
     """Test creating a property."""
-    # Create a user first
+    # Create a user and a property linked through the relationship, so one
+    # commit persists both without an intermediate refresh round trip
     user = User(
         email="test@example.com",
         full_name="Test User",
         supabase_id="test-supabase-id",
     )
-    test_db.add(user)
-    await test_db.commit()
-    await test_db.refresh(user)
-    
-    # Create a new property
     property = Property(
-        user_id=user.id,
+        user=user,
         title="Test Property",
         description="A test property",
         category="apartment",
@@ -46,9 +44,9 @@ async def test_create_property(test_db):
         year_built=2020,
         features=["feature1", "feature2"],
     )
-    
-    # Add to database
-    test_db.add(property)
+
+    # Add both to the database in a single commit
+    test_db.add_all([user, property])
     await test_db.commit()
     
     # Query the property
@@ -82,33 +80,67 @@ async def test_create_property(test_db):
 @pytest.mark.asyncio
 async def test_property_relationships(test_db):
     """Test property relationships."""
-    # Create a user first
+    # Create a user and a property linked through the relationship, so one
+    # commit persists both without an intermediate refresh round trip
     user = User(
         email="test@example.com",
         full_name="Test User",
         supabase_id="test-supabase-id",
     )
-    test_db.add(user)
-    await test_db.commit()
-    await test_db.refresh(user)
-    
-    # Create a new property
     property = Property(
-        user_id=user.id,
+        user=user,
         title="Test Property",
         category="apartment",
     )
-    
-    # Add to database
-    test_db.add(property)
+
+    # Add both to the database in a single commit
+    test_db.add_all([user, property])
     await test_db.commit()
     
+    # Load the relationships explicitly (lazy loading is not available
+    # in an async session)
+    await test_db.refresh(property, ["user", "images"])
+
     # Check that the property has the expected relationships
     assert hasattr(property, "user")
     assert hasattr(property, "images")
     
     # Check that the user relationship is set correctly
     assert property.user.id == user.id
-    
+
     # Check that the images relationship is an empty list
     assert property.images == []
+
+
+@pytest.mark.asyncio
+async def test_property_raiseload_blocks_lazy_load(test_db):
+    """Test that raiseload fails fast on unloaded relationships."""
+    # Create a user and a property in a single commit
+    user = User(
+        email="test@example.com",
+        full_name="Test User",
+        supabase_id="test-supabase-id",
+    )
+    property = Property(
+        user=user,
+        title="Test Property",
+        category="apartment",
+    )
+    test_db.add_all([user, property])
+    await test_db.commit()
+    test_db.expunge_all()
+
+    # Query with the same loader options the list endpoints use
+    result = await test_db.execute(
+        select(Property)
+        .options(selectinload(Property.images), raiseload("*"))
+        .where(Property.title == "Test Property")
+    )
+    db_property = result.scalars().first()
+
+    # The explicitly loaded relationship is available
+    assert db_property.images == []
+
+    # Any other relationship raises instead of silently lazy loading
+    with pytest.raises(InvalidRequestError):
+        db_property.user
@@ -55,6 +55,10 @@ async def test_user_relationships(test_db):
     test_db.add(user)
     await test_db.commit()
     
+    # Load the relationships explicitly (lazy loading is not available
+    # in an async session)
+    await test_db.refresh(user, ["properties", "voice_settings", "email_templates"])
+
     # Check that the user has the expected relationships
     assert hasattr(user, "properties")
     assert hasattr(user, "voice_settings")